@@ -1,6 +1,7 @@
 """File explorer controller - Production Ready"""
 
 import logging
+from functools import partial
 from PyQt5.QtCore import QObject, QThread, pyqtSignal
 from PyQt5.QtWidgets import QMessageBox
 import os
@@ -50,6 +51,7 @@ class FileController(QObject):
         self.current_device_serial = None
         self._last_connected_serial = None
         self.load_worker = None
+        self.child_workers = []  # Workers loading expanded subdirectories
         self.show_hidden = False
         
         self.setup_connections()
@@ -64,6 +66,7 @@ class FileController(QObject):
         self.file_widget.rename_requested.connect(self.rename_file)
         self.file_widget.create_folder_requested.connect(self.create_folder)
         self.file_widget.show_hidden_changed.connect(self.on_show_hidden_changed)
+        self.file_widget.children_requested.connect(self.load_device_children)
 
     def on_show_hidden_changed(self, show_hidden):
         """Handle show hidden files toggle"""
@@ -116,6 +119,31 @@ class FileController(QObject):
         self.file_widget.update_device_files(files)
         logger.info(f"Loaded {len(files)} files")
     
+    def load_device_children(self, path):
+        """Load the contents of an expanded device directory"""
+        if not self.current_device_serial:
+            self.file_widget.update_device_children(path, [])
+            return
+        
+        # Drop references to finished workers
+        self.child_workers = [w for w in self.child_workers if w.isRunning()]
+        
+        worker = FileLoadWorker(
+            self.file_manager,
+            self.current_device_serial,
+            path,
+            self.show_hidden
+        )
+        worker.finished.connect(partial(self.file_widget.update_device_children, path))
+        worker.error.connect(partial(self.on_children_error, path))
+        self.child_workers.append(worker)
+        worker.start()
+    
+    def on_children_error(self, path, error):
+        """Handle subdirectory load error"""
+        logger.warning(f"Failed to load {path}: {error}")
+        self.file_widget.update_device_children(path, [])
+    
     def on_load_error(self, error):
         """Handle load error"""
         QMessageBox.critical(
@@ -240,9 +268,9 @@ class FileController(QObject):
                 "Success",
                 "Renamed successfully"
             )
-            # Refresh
-            current_path = self.file_widget.current_device_path
-            self.load_device_files(current_path)
+            # Update the single row; reload only if it can't be patched
+            if not self.file_widget.rename_device_item(old_path, new_path):
+                self.load_device_files(self.file_widget.current_device_path)
         else:
             QMessageBox.critical(
                 self.file_widget,
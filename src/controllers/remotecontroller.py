@@ -47,6 +47,10 @@ class RemoteController(QObject):
         if serial == self._last_connected_serial:
             return
         
+        # Drop handle of the previously selected device
+        if self._last_connected_serial:
+            self.remote_manager.invalidate_device(self._last_connected_serial)
+        
         self.current_device_serial = serial
         self._last_connected_serial = serial
         
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
 @dataclass
@@ -22,6 +23,21 @@ class AppInfo:
         """Get size in MB"""
         return round(self.size / (1024 * 1024), 2)
     
+    @cached_property
+    def size_str(self):
+        """Formatted size string (cached for display)"""
+        return f"{self.size_mb} MB"
+    
+    @cached_property
+    def name_lower(self):
+        """Lowercase app name (cached for search)"""
+        return self.app_name.lower()
+    
+    @cached_property
+    def package_lower(self):
+        """Lowercase package name (cached for search)"""
+        return self.package_name.lower()
+    
     @property
     def app_type(self):
         """Get app type string"""
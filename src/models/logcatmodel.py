@@ -5,6 +5,25 @@ from datetime import datetime
 from typing import Optional
 
 
+LEVEL_TEXT = {
+    'V': 'Verbose',
+    'D': 'Debug',
+    'I': 'Info',
+    'W': 'Warning',
+    'E': 'Error',
+    'F': 'Fatal',
+}
+
+LEVEL_COLORS = {
+    'V': '#888888',  # Gray
+    'D': '#4ec9b0',  # Cyan
+    'I': '#ffffff',  # White
+    'W': '#dcdcaa',  # Yellow
+    'E': '#f48771',  # Red
+    'F': '#d16969',  # Dark Red
+}
+
+
 @dataclass
 class LogEntry:
     """Represents a single log entry"""
@@ -18,28 +37,12 @@ class LogEntry:
     @property
     def level_text(self):
         """Get full level name"""
-        levels = {
-            'V': 'Verbose',
-            'D': 'Debug',
-            'I': 'Info',
-            'W': 'Warning',
-            'E': 'Error',
-            'F': 'Fatal',
-        }
-        return levels.get(self.level, 'Unknown')
+        return LEVEL_TEXT.get(self.level, 'Unknown')
     
     @property
     def level_color(self):
         """Get color for this log level"""
-        colors = {
-            'V': '#888888',  # Gray
-            'D': '#4ec9b0',  # Cyan
-            'I': '#ffffff',  # White
-            'W': '#dcdcaa',  # Yellow
-            'E': '#f48771',  # Red
-            'F': '#d16969',  # Dark Red
-        }
-        return colors.get(self.level, '#ffffff')
+        return LEVEL_COLORS.get(self.level, '#ffffff')
     
     def __str__(self):
         return f"{self.timestamp} {self.level}/{self.tag}: {self.message}"
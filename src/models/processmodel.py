@@ -1,6 +1,7 @@
 """Process data model"""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 
@@ -21,6 +22,16 @@ class ProcessInfo:
         """Get memory in MB"""
         return round(self.mem_size / 1024, 2)
     
+    @cached_property
+    def pid_str(self):
+        """PID as a string (cached for display)"""
+        return str(self.pid)
+    
+    @cached_property
+    def mem_str(self):
+        """Memory in MB as a string (cached for display)"""
+        return str(self.mem_mb)
+    
     @property
     def state_text(self):
         """Get human-readable state"""
@@ -1,7 +1,8 @@
 """Remote control manager"""
 
 import logging
-from typing import Tuple
+from typing import Dict, Optional, Tuple
+from ppadb.device import Device as AdbDevice
 from models.remotecontrol import KeyCode
 
 logger = logging.getLogger(__name__)
@@ -13,8 +14,57 @@ class RemoteManager:
     def __init__(self, adb_manager):
         """Initialize remote manager"""
         self.adb_manager = adb_manager
+        self._device_cache: Dict[str, AdbDevice] = {}
         logger.info("Remote manager initialized")
     
+    def _get_device(self, device_serial: str) -> Optional[AdbDevice]:
+        """
+        Get device handle, resolving it through ADB manager on first use
+        
+        Args:
+            device_serial: Device serial number
+            
+        Returns:
+            ADB device object or None
+        """
+        device = self._device_cache.get(device_serial)
+        if device is None:
+            device = self.adb_manager.get_device_by_serial(device_serial)
+            if device:
+                self._device_cache[device_serial] = device
+        return device
+    
+    def invalidate_device(self, device_serial: Optional[str] = None):
+        """
+        Drop cached device handle(s)
+        
+        Args:
+            device_serial: Device serial number, or None to clear all
+        """
+        if device_serial is None:
+            self._device_cache.clear()
+        else:
+            self._device_cache.pop(device_serial, None)
+    
+    def _exec_out(self, device: AdbDevice, command: str) -> bytes:
+        """
+        Run command via the binary-clean exec service (like `adb exec-out`)
+        
+        Unlike `shell:`, no PTY is involved, so output needs no CRLF
+        translation on the host.
+        
+        Args:
+            device: ADB device object
+            command: Command to run on device
+            
+        Returns:
+            Raw command output
+        """
+        conn = device.create_connection()
+        with conn:
+            conn.send(f"exec:{command}")
+            return conn.read_all()
+    
     def send_tap(self, device_serial: str, x: int, y: int) -> bool:
         """
         Send tap event
@@ -27,12 +77,12 @@ class RemoteManager:
         Returns:
             True if successful
         """
-        device = self.adb_manager.get_device_by_serial(device_serial)
+        device = self._get_device(device_serial)
         if not device:
             return False
         
         try:
-            logger.info(f"Tap at ({x}, {y})")
+            logger.debug("Tap at (%d, %d)", x, y)
             device.shell(f"input tap {x} {y}")
             return True
         except Exception as e:
@@ -52,12 +102,12 @@ class RemoteManager:
         Returns:
             True if successful
         """
-        device = self.adb_manager.get_device_by_serial(device_serial)
+        device = self._get_device(device_serial)
         if not device:
             return False
         
         try:
-            logger.info(f"Swipe from ({x1}, {y1}) to ({x2}, {y2})")
+            logger.debug("Swipe from (%d, %d) to (%d, %d)", x1, y1, x2, y2)
             device.shell(f"input swipe {x1} {y1} {x2} {y2} {duration}")
             return True
         except Exception as e:
@@ -75,7 +125,7 @@ class RemoteManager:
         Returns:
             True if successful
         """
-        device = self.adb_manager.get_device_by_serial(device_serial)
+        device = self._get_device(device_serial)
         if not device:
             return False
         
@@ -100,12 +150,12 @@ class RemoteManager:
         Returns:
             True if successful
         """
-        device = self.adb_manager.get_device_by_serial(device_serial)
+        device = self._get_device(device_serial)
         if not device:
             return False
         
         try:
-            logger.info(f"Key event: {keycode.name}")
+            logger.debug("Key event: %s", keycode.name)
             device.shell(f"input keyevent {keycode.value}")
             return True
         except Exception as e:
@@ -122,7 +172,7 @@ class RemoteManager:
         Returns:
             Tuple of (width, height)
         """
-        device = self.adb_manager.get_device_by_serial(device_serial)
+        device = self._get_device(device_serial)
         if not device:
             return (1080, 1920)  # Default
         
@@ -150,21 +200,25 @@ class RemoteManager:
         Returns:
             True if successful
         """
-        device = self.adb_manager.get_device_by_serial(device_serial)
+        device = self._get_device(device_serial)
         if not device:
             return False
         
         try:
             logger.info(f"Taking screenshot -> {local_path}")
             
-            # Take screenshot on device
-            device.shell("screencap -p /sdcard/screenshot.png")
-            
-            # Pull to local
-            device.pull("/sdcard/screenshot.png", local_path)
-            
-            # Clean up
-            device.shell("rm /sdcard/screenshot.png")
+            # Stream PNG straight from the device (one round-trip)
+            png_data = self._exec_out(device, "screencap -p")
+            if png_data:
+                with open(local_path, 'wb') as f:
+                    f.write(png_data)
+            else:
+                # Fallback: capture to device storage and pull
+                device.shell("screencap -p /sdcard/screenshot.png")
+                device.pull("/sdcard/screenshot.png", local_path)
+                
+                # Clean up in background on the device
+                device.shell("rm -f /sdcard/screenshot.png &")
             
             logger.info("Screenshot saved")
             return True
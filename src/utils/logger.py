@@ -1,17 +1,30 @@
 """Application logging configuration"""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
+# Background listener that performs the actual handler I/O
+_queue_listener = None
+
+
 def setup_logging(log_file='adb-manager.log', level=logging.INFO):
     """
     Configure application-wide logging
     
+    Records are pushed onto a queue and written by a background
+    QueueListener thread, so logging from UI callbacks never blocks
+    the Qt event loop on file I/O.
+    
     Args:
         log_file: Path to log file
         level: Logging level (INFO, DEBUG, ERROR, etc.)
     """
+    global _queue_listener
+    
     # Create logs directory if it doesn't exist
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -19,19 +32,35 @@ def setup_logging(log_file='adb-manager.log', level=logging.INFO):
     # Configure logging format
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
+    formatter = logging.Formatter(log_format, date_format)
     
-    # Setup handlers
+    # Setup handlers (run on the listener thread)
     handlers = [
-        logging.FileHandler(log_file, encoding='utf-8'),
+        logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=5_000_000, backupCount=3, encoding='utf-8'
+        ),
         logging.StreamHandler(sys.stdout)
     ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Stop a previous listener if logging is reconfigured
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    else:
+        atexit.register(shutdown_logging)
+    
+    log_queue = queue.Queue(-1)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Configure logging
     logging.basicConfig(
         level=level,
-        format=log_format,
-        datefmt=date_format,
-        handlers=handlers
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        force=True
     )
     
     # Suppress verbose library logs
@@ -40,3 +69,11 @@ def setup_logging(log_file='adb-manager.log', level=logging.INFO):
     logger = logging.getLogger(__name__)
     logger.info("Logging system initialized")
     return logger
+
+
+def shutdown_logging():
+    """Flush queued log records and stop the background listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
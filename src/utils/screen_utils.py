@@ -2,10 +2,69 @@
 
 from PyQt5.QtWidgets import QDesktopWidget, QApplication
 from PyQt5.QtCore import QRect, QSize
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cached screen metrics (cleared when the primary screen changes)
+_geom: Optional[QRect] = None
+_dpi: Optional[float] = None
+_watching_app = False  # primaryScreenChanged connected
+_watched_screen = None  # Screen whose signals invalidate the cache
+
+
+def _invalidate(*args):
+    """Clear cached screen metrics"""
+    global _geom, _dpi
+    _geom = None
+    _dpi = None
+    logger.info("Screen metrics cache invalidated")
+
+
+def _watch_screen(screen):
+    """
+    Make a screen's geometry/DPI changes invalidate the cache
+    
+    Args:
+        screen: QScreen to watch, or None
+    """
+    global _watched_screen
+    if _watched_screen is not None:
+        try:
+            _watched_screen.geometryChanged.disconnect(_invalidate)
+            _watched_screen.availableGeometryChanged.disconnect(_invalidate)
+            _watched_screen.logicalDotsPerInchChanged.disconnect(_invalidate)
+        except (RuntimeError, TypeError):
+            pass  # Screen was unplugged and already deleted
+    
+    _watched_screen = screen
+    if screen is not None:
+        screen.geometryChanged.connect(_invalidate)
+        screen.availableGeometryChanged.connect(_invalidate)
+        screen.logicalDotsPerInchChanged.connect(_invalidate)
+
+
+def _watch_primary_screen():
+    """Connect primary screen change signals to cache invalidation (once)"""
+    global _watching_app
+    if _watching_app:
+        return
+    
+    app = QApplication.instance()
+    if not app:
+        return
+    
+    app.primaryScreenChanged.connect(_on_primary_screen_changed)
+    _watching_app = True
+    _watch_screen(app.primaryScreen())
+
+
+def _on_primary_screen_changed(screen):
+    """Move the watchers to the new primary screen"""
+    _invalidate()
+    _watch_screen(screen)
+
 
 def get_screen_geometry():
     """
@@ -14,11 +73,14 @@ def get_screen_geometry():
     Returns:
         QRect: Available screen geometry
     """
-    desktop = QDesktopWidget()
-    screen = desktop.availableGeometry()
+    global _geom
+    if _geom is None:
+        desktop = QDesktopWidget()
+        _geom = desktop.availableGeometry()
+        _watch_primary_screen()
+        logger.info(f"Screen geometry: {_geom.width()}x{_geom.height()}")
     
-    logger.info(f"Screen geometry: {screen.width()}x{screen.height()}")
-    return screen
+    return QRect(_geom)
 
 
 def get_optimal_window_size(min_width=800, min_height=600, 
@@ -77,14 +139,19 @@ def get_dpi_scale_factor():
     Returns:
         float: DPI scale factor (1.0 = 100%, 1.5 = 150%, etc.)
     """
+    global _dpi
+    if _dpi is not None:
+        return _dpi
+    
     app = QApplication.instance()
     if app:
         screen = app.primaryScreen()
         dpi = screen.logicalDotsPerInch()
         # Standard DPI is 96
-        scale = dpi / 96.0
-        logger.info(f"DPI scale factor: {scale:.2f} ({int(scale * 100)}%)")
-        return scale
+        _dpi = dpi / 96.0
+        _watch_primary_screen()
+        logger.info(f"DPI scale factor: {_dpi:.2f} ({int(_dpi * 100)}%)")
+        return _dpi
     return 1.0
 
 
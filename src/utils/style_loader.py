@@ -1,12 +1,60 @@
 """Stylesheet loader utility"""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _get_styles_dir() -> Path:
+    """Resolve resources/styles directory (handles PyInstaller bundles)"""
+    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+        base_path = Path(getattr(sys, '_MEIPASS')) / "resources"
+    else:
+        base_path = Path(__file__).resolve().parent.parent.parent / "resources"
+    return base_path / "styles"
+
+
+def _preload_stylesheets() -> dict:
+    """Read every QSS file in the styles directory once"""
+    cache = {}
+    try:
+        for style_file in _get_styles_dir().glob("*.qss"):
+            cache[style_file.name] = style_file.read_text(encoding='utf-8')
+    except Exception as e:
+        logger.error(f"Error preloading stylesheets: {e}")
+    return cache
+
+
+# Stylesheets preloaded at import so widget construction does no file I/O
+_CACHE: dict = _preload_stylesheets()
+
+
+@lru_cache(maxsize=128)
+def _read_qss(path: str) -> str:
+    """
+    Read stylesheet file from disk (cached per resolved path)
+    
+    Args:
+        path: Absolute path to the stylesheet file
+    
+    Returns:
+        Stylesheet content as string, empty string if file not found
+    """
+    style_path = Path(path)
+    
+    if not style_path.exists():
+        logger.warning(f"Stylesheet not found: {style_path}")
+        return ""
+    
+    with open(style_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+        logger.info(f"Loaded stylesheet: {style_path.name}")
+        return content
+
+
 def load_stylesheet(stylesheet_name: str) -> str:
     """
     Load stylesheet from resources/styles directory
@@ -17,40 +65,21 @@ def load_stylesheet(stylesheet_name: str) -> str:
     Returns:
         Stylesheet content as string, empty string if file not found
     """
+    if stylesheet_name in _CACHE:
+        return _CACHE[stylesheet_name]
+    
     try:
-        # Get path to stylesheet
-        if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-            base_path = Path(getattr(sys, '_MEIPASS')) / "resources"
-        else:
-            base_path = Path(__file__).resolve().parent.parent.parent / "resources"
-
-        style_path = base_path / "styles" / stylesheet_name
-        
-        if not style_path.exists():
-            logger.warning(f"Stylesheet not found: {style_path}")
-            return ""
-        
-        # Read and return stylesheet
-        with open(style_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            logger.info(f"Loaded stylesheet: {stylesheet_name}")
-            return content
+        style_path = _get_styles_dir() / stylesheet_name
+        return _read_qss(str(style_path))
             
     except Exception as e:
         logger.error(f"Error loading stylesheet {stylesheet_name}: {e}")
         return ""
 
 
-def load_combined_stylesheets(*stylesheet_names: str) -> str:
-    """
-    Load and combine multiple stylesheets
-    
-    Args:
-        *stylesheet_names: Variable number of stylesheet names
-    
-    Returns:
-        Combined stylesheet content
-    """
+@lru_cache(maxsize=32)
+def _combine_stylesheets(stylesheet_names: tuple) -> str:
+    """Combine stylesheets (cached per name tuple)"""
     combined = []
     
     for name in stylesheet_names:
@@ -61,3 +90,25 @@ def load_combined_stylesheets(*stylesheet_names: str) -> str:
             combined.append("")
     
     return "\n".join(combined)
+
+
+def load_combined_stylesheets(*stylesheet_names: str) -> str:
+    """
+    Load and combine multiple stylesheets
+    
+    Args:
+        *stylesheet_names: Variable number of stylesheet names
+    
+    Returns:
+        Combined stylesheet content
+    """
+    return _combine_stylesheets(tuple(stylesheet_names))
+
+
+def clear_style_cache():
+    """Reload stylesheets from disk (e.g. to hot-reload QSS during development)"""
+    _CACHE.clear()
+    _CACHE.update(_preload_stylesheets())
+    _read_qss.cache_clear()
+    _combine_stylesheets.cache_clear()
+    logger.info("Stylesheet cache cleared")
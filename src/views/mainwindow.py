@@ -4,10 +4,10 @@ import os
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QTabWidget,
     QAction, QMenuBar, QToolBar, QStatusBar, QLabel,
-    QMessageBox, QScrollArea
+    QMessageBox, QScrollArea, QFrame
 )
 from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QIcon, QPixmapCache
 
 from views.widgets.devicepanel import DevicePanel
 from views.widgets.deviceinfo import DeviceInfoWidget
@@ -28,6 +28,23 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Application icon, decoded once and shared by all windows/dialogs
+_APP_ICON = None
+
+
+def _get_app_icon():
+    """
+    Get the shared application icon
+    
+    Built on first use (needs a QApplication) and also stored in
+    QPixmapCache so message boxes reuse the decoded pixmap.
+    """
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon(APP_ICON_PATH)
+        QPixmapCache.insert("app-icon", _APP_ICON.pixmap(256, 256))
+    return _APP_ICON
+
 
 class MainWindow(QMainWindow):
     """Main application window with tabbed interface"""
@@ -37,15 +54,19 @@ class MainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        
+        # Suspend painting while the window is assembled
+        self.setUpdatesEnabled(False)
         self.setup_ui()
         self.setup_menu_bar()
         self.setup_status_bar()
         self.apply_responsive_sizing()
+        self.setUpdatesEnabled(True)
     
     def setup_ui(self):
         """Setup main window UI"""
         self.setWindowTitle(APP_NAME)
-        self.setWindowIcon(QIcon(APP_ICON_PATH)) 
+        self.setWindowIcon(_get_app_icon())
         
         # Set absolute minimum size
         self.setMinimumSize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
@@ -68,7 +89,9 @@ class MainWindow(QMainWindow):
         self.tab_widget.setDocumentMode(True)
         
         # Create placeholder tabs (will be replaced with actual widgets later)
+        self.tab_widget.blockSignals(True)
         self.create_placeholder_tabs()
+        self.tab_widget.blockSignals(False)
         
         layout.addWidget(self.tab_widget)
         central_widget.setLayout(layout)
@@ -79,6 +102,12 @@ class MainWindow(QMainWindow):
         scale = get_dpi_scale_factor()
         logger.info(f"Display scale: {int(scale * 100)}%")
         
+        # Show maximized if configured (window size is discarded anyway)
+        if WINDOW_START_MAXIMIZED:
+            self.showMaximized()
+            logger.info("Window opened in maximized mode")
+            return
+        
         # Get optimal size
         optimal_size = get_optimal_window_size(
             min_width=WINDOW_MIN_WIDTH,
@@ -89,35 +118,37 @@ class MainWindow(QMainWindow):
             max_height_percent=WINDOW_MAX_HEIGHT_PERCENT
         )
         
-        # Resize window
+        # Resize window and center it on screen
         self.resize(optimal_size)
+        center_window(self)
+        logger.info(f"Window sized to {optimal_size.width()}x{optimal_size.height()}")
+    
+    def _wrap_scroll(self, widget):
+        """
+        Wrap widget in a frameless, vertically scrolling scroll area
         
-        # Center window on screen (only if not maximizing)
-        if not WINDOW_START_MAXIMIZED:
-            center_window(self)
-        
-        # Show maximized if configured
-        if WINDOW_START_MAXIMIZED:
-            self.showMaximized()
-            logger.info("Window opened in maximized mode")
-        else:
-            logger.info(f"Window sized to {optimal_size.width()}x{optimal_size.height()}")
+        Args:
+            widget: Tab content widget
+            
+        Returns:
+            QScrollArea containing the widget
+        """
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QFrame.NoFrame)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        scroll.setWidget(widget)
+        return scroll
     
     def create_placeholder_tabs(self):
         """Create tabs for features"""
         # Dashboard tab with device info (ACTUAL IMPLEMENTATION)
         self.dashboard_widget = DeviceInfoWidget()
-        scroll_dashboard = QScrollArea()
-        scroll_dashboard.setWidgetResizable(True)
-        scroll_dashboard.setWidget(self.dashboard_widget)
-        self.tab_widget.addTab(scroll_dashboard, "Dashboard")
+        self.tab_widget.addTab(self._wrap_scroll(self.dashboard_widget), "Dashboard")
         
         # Applications tab (ACTUAL IMPLEMENTATION)
         self.app_manager_widget = AppManagerWidget()
-        scroll_apps = QScrollArea()
-        scroll_apps.setWidgetResizable(True)
-        scroll_apps.setWidget(self.app_manager_widget)
-        self.tab_widget.addTab(scroll_apps, "Applications")
+        self.tab_widget.addTab(self._wrap_scroll(self.app_manager_widget), "Applications")
 
         # File Explorer tab
         self.file_explorer_widget = FileExplorerWidget()
@@ -125,10 +156,7 @@ class MainWindow(QMainWindow):
 
         # Processes tab
         self.process_monitor_widget = ProcessMonitorWidget()
-        scroll_processes = QScrollArea()
-        scroll_processes.setWidgetResizable(True)
-        scroll_processes.setWidget(self.process_monitor_widget)
-        self.tab_widget.addTab(scroll_processes, "Processes")
+        self.tab_widget.addTab(self._wrap_scroll(self.process_monitor_widget), "Processes")
         
         # Terminal tab
         self.terminal_widget = TerminalWidget()
@@ -140,10 +168,7 @@ class MainWindow(QMainWindow):
         
         # Remote Control tab
         self.remote_control_widget = RemoteControlWidget()
-        scroll_remote = QScrollArea()
-        scroll_remote.setWidgetResizable(True)
-        scroll_remote.setWidget(self.remote_control_widget)
-        self.tab_widget.addTab(scroll_remote, "Remote Control")
+        self.tab_widget.addTab(self._wrap_scroll(self.remote_control_widget), "Remote Control")
     
     def setup_menu_bar(self):
         """Create menu bar"""
@@ -1,18 +1,209 @@
 """Application manager widget"""
 
+from functools import partial
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
     QPushButton, QLineEdit, QLabel, QCheckBox, QHeaderView,
-    QMenu, QFileDialog, QMessageBox
+    QMenu, QFileDialog, QMessageBox, QStyledItemDelegate, QStyle
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QTimer, QSize
+from PyQt5.QtGui import QColor, QFont, QFontMetrics
 import logging
 
 from utils.style_loader import load_stylesheet  # ADD THIS IMPORT
 
 logger = logging.getLogger(__name__)
 
+_TABLE_STYLE = load_stylesheet('table_style.qss')
+
+# Cell colors (parsed once, shared by every cell)
+_FG_NAME = QColor("#ffffff")
+_FG_PACKAGE = QColor("#999999")
+_FG_DEFAULT = QColor("#cccccc")
+_FG_SYSTEM = QColor("#ce9178")  # Orange for system
+_FG_USER = QColor("#4ec9b0")  # Cyan for user
+_FG_RUNNING = QColor("#4ade80")  # Bright green text
+_FG_STOPPED = QColor("#9ca3af")  # Gray text
+_BG_RUNNING = QColor("#052e16")  # Dark green background
+_BG_STOPPED = QColor("#1f2937")  # Dark gray background
+
+_STATUS_RUNNING = "🟢 Running"
+_STATUS_STOPPED = "⚫ Stopped"
+STATUS_COLUMN = 5
+
+
+def _make_status_font(bold):
+    """Create status column font"""
+    font = QFont()
+    font.setPointSize(9)
+    font.setBold(bold)
+    return font
+
+
+class AppTableModel(QAbstractTableModel):
+    """Table model serving AppInfo rows on demand"""
+    
+    HEADERS = ["App Name", "Package", "Version", "Size", "Type", "Status"]
+    FETCH_BATCH_SIZE = 100  # Rows exposed to the view per fetchMore()
+    MAX_REMOVE_RUNS = 32  # Above this, a reset is cheaper than removals
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.apps = []
+        self._loaded_rows = 0
+    
+    def set_apps(self, apps):
+        """Replace displayed apps"""
+        self.beginResetModel()
+        self.apps = apps
+        self._loaded_rows = min(len(apps), self.FETCH_BATCH_SIZE)
+        self.endResetModel()
+    
+    def update_apps(self, apps):
+        """
+        Update displayed apps, removing rows in place when possible
+        
+        When apps is a subsequence of the current rows (e.g. the search
+        text was refined), only the vanished rows are removed. Anything
+        else falls back to a full reset.
+        
+        Args:
+            apps: New list of AppInfo objects to display
+        """
+        if apps is self.apps or len(apps) >= len(self.apps) or not self._is_subsequence(apps):
+            self.set_apps(apps)
+            return
+        
+        # Find contiguous runs of vanished rows among the loaded rows
+        keep = {id(app) for app in apps}
+        runs = []
+        row = self._loaded_rows - 1
+        while row >= 0:
+            if id(self.apps[row]) in keep:
+                row -= 1
+                continue
+            end = row
+            while row >= 0 and id(self.apps[row]) not in keep:
+                row -= 1
+            runs.append((row + 1, end))
+        
+        if len(runs) > self.MAX_REMOVE_RUNS:
+            self.set_apps(apps)
+            return
+        
+        # Remove bottom-up so earlier row numbers stay valid
+        current = list(self.apps)
+        for start, end in runs:
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del current[start:end + 1]
+            self._loaded_rows -= end - start + 1
+            self.apps = current
+            self.endRemoveRows()
+        
+        # Loaded rows now match the head of apps; swap in the full list
+        self.apps = apps
+    
+    def _is_subsequence(self, apps):
+        """Check if apps keeps the current rows' relative order"""
+        remaining = iter(self.apps)
+        return all(any(app is old for old in remaining) for app in apps)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded_rows
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded_rows < len(self.apps)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Expose the next batch of rows as the view scrolls near the end"""
+        if parent.isValid():
+            return
+        
+        count = min(self.FETCH_BATCH_SIZE, len(self.apps) - self._loaded_rows)
+        if count <= 0:
+            return
+        
+        self.beginInsertRows(QModelIndex(), self._loaded_rows, self._loaded_rows + count - 1)
+        self._loaded_rows += count
+        self.endInsertRows()
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        app = self.apps[index.row()]
+        column = index.column()
+        
+        # Status column is painted by StatusDelegate from this flag
+        if role == Qt.UserRole and column == STATUS_COLUMN:
+            return app.is_running
+        
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return app.app_name
+            if column == 1:
+                return app.package_name
+            if column == 2:
+                return app.version
+            if column == 3:
+                return app.size_str
+            if column == 4:
+                return app.app_type
+            return _STATUS_RUNNING if app.is_running else _STATUS_STOPPED
+        
+        if role == Qt.ForegroundRole:
+            if column == 0:
+                return _FG_NAME
+            if column == 1:
+                return _FG_PACKAGE
+            if column == 4:
+                return _FG_SYSTEM if app.is_system else _FG_USER
+            return _FG_DEFAULT
+        
+        if role == Qt.TextAlignmentRole and column == 3:
+            return Qt.AlignRight | Qt.AlignVCenter
+        
+        return None
+
+
+class StatusDelegate(QStyledItemDelegate):
+    """Paints the Status column directly instead of via the style system"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font_running = _make_status_font(bold=True)
+        self._font_stopped = _make_status_font(bold=False)
+    
+    def paint(self, painter, option, index):
+        is_running = index.data(Qt.UserRole)
+        
+        painter.save()
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+        else:
+            painter.fillRect(option.rect, _BG_RUNNING if is_running else _BG_STOPPED)
+        
+        painter.setFont(self._font_running if is_running else self._font_stopped)
+        painter.setPen(_FG_RUNNING if is_running else _FG_STOPPED)
+        painter.drawText(
+            option.rect, Qt.AlignCenter,
+            _STATUS_RUNNING if is_running else _STATUS_STOPPED
+        )
+        painter.restore()
+    
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        text_width = QFontMetrics(self._font_running).horizontalAdvance(_STATUS_RUNNING)
+        return QSize(max(size.width(), text_width + 16), size.height())
+
 
 class AppManagerWidget(QWidget):
     """Application management interface"""
@@ -25,10 +216,33 @@ class AppManagerWidget(QWidget):
     stop_requested = pyqtSignal(str)
     clear_data_requested = pyqtSignal(str)
     
+    _MENU_STYLE = """
+        QMenu {
+            background-color: #2d2d30;
+            color: #cccccc;
+            border: 1px solid #3e3e42;
+        }
+        QMenu::item {
+            padding: 6px 20px;
+        }
+        QMenu::item:selected {
+            background-color: #094771;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.apps = []
         self.filtered_apps = []
+        self._apps_version = 0  # Bumped whenever self.apps is replaced
+        self._last_filter_key = None
+        
+        # Debounce search typing into a single filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self.filter_apps(self.search_input.text()))
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -41,11 +255,11 @@ class AppManagerWidget(QWidget):
         layout.addLayout(toolbar)
         
         # App table
-        self.app_table = QTableWidget()
-        self.app_table.setColumnCount(6)
-        self.app_table.setHorizontalHeaderLabels([
-            "App Name", "Package", "Version", "Size", "Type", "Status"
-        ])
+        self.app_model = AppTableModel(self)
+        self.app_table = QTableView()
+        self.app_table.setModel(self.app_model)
+        self.status_delegate = StatusDelegate(self.app_table)
+        self.app_table.setItemDelegateForColumn(STATUS_COLUMN, self.status_delegate)
         
         # Configure table
         header = self.app_table.horizontalHeader()
@@ -56,21 +270,25 @@ class AppManagerWidget(QWidget):
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
         
-        self.app_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.app_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.app_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.app_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.app_table.setAlternatingRowColors(True)
         self.app_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.app_table.customContextMenuRequested.connect(self.show_context_menu)
         
         # APPLY TABLE STYLESHEET
-        table_style = load_stylesheet('table_style.qss')
-        if table_style:
-            self.app_table.setStyleSheet(table_style)
+        if _TABLE_STYLE:
+            self.app_table.setStyleSheet(_TABLE_STYLE)
         
         # Set row height (make rows thinner)
         self.app_table.verticalHeader().setDefaultSectionSize(32)  # Thin rows
         self.app_table.verticalHeader().setVisible(False)  # Hide row numbers
         
+        # Uniform rows: skip per-row height/wrap metrics when painting
+        self.app_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.app_table.setWordWrap(False)
+        self.app_table.setTextElideMode(Qt.ElideRight)
+        
         # Enable grid
         self.app_table.setShowGrid(True)
         
@@ -90,7 +308,7 @@ class AppManagerWidget(QWidget):
         # Search
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search apps...")
-        self.search_input.textChanged.connect(self.filter_apps)
+        self.search_input.textChanged.connect(lambda _: self._filter_timer.start())
         self.search_input.setMaximumWidth(250)
         
         # Show system apps checkbox
@@ -137,47 +355,32 @@ class AppManagerWidget(QWidget):
     
     def show_context_menu(self, position):
         """Show context menu for app actions"""
-        if self.app_table.rowCount() == 0:
-            return
-        
-        item = self.app_table.itemAt(position)
-        if not item:
+        index = self.app_table.indexAt(position)
+        if not index.isValid():
             return
         
-        row = item.row()
+        row = index.row()
         if row < 0 or row >= len(self.filtered_apps):
             return
         
         app = self.filtered_apps[row]
         
         menu = QMenu()
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2d2d30;
-                color: #cccccc;
-                border: 1px solid #3e3e42;
-            }
-            QMenu::item {
-                padding: 6px 20px;
-            }
-            QMenu::item:selected {
-                background-color: #094771;
-            }
-        """)
+        menu.setStyleSheet(self._MENU_STYLE)
         
         # Show running status
         if app.is_running:            
             force_stop_action = menu.addAction("⏹ Force Stop")
-            force_stop_action.triggered.connect(lambda: self.stop_requested.emit(app.package_name))
+            force_stop_action.triggered.connect(partial(self.stop_requested.emit, app.package_name))
         else:            
             start_action = menu.addAction("▶ Start App")
-            start_action.triggered.connect(lambda: self.start_requested.emit(app.package_name))
+            start_action.triggered.connect(partial(self.start_requested.emit, app.package_name))
         
         menu.addSeparator()
         
         # Other actions
         clear_action = menu.addAction("🗑 Clear Data")
-        clear_action.triggered.connect(lambda: self.clear_data_requested.emit(app.package_name))
+        clear_action.triggered.connect(partial(self.clear_data_requested.emit, app.package_name))
         
         uninstall_action = menu.addAction("❌ Uninstall")
         
@@ -185,7 +388,7 @@ class AppManagerWidget(QWidget):
             uninstall_action.setEnabled(False)
             uninstall_action.setText("❌ Uninstall (System App)")
         else:
-            uninstall_action.triggered.connect(lambda: self._confirm_and_uninstall(app))
+            uninstall_action.triggered.connect(partial(self._confirm_and_uninstall, app))
         
         menu.exec_(self.app_table.mapToGlobal(position))
     
@@ -204,23 +407,25 @@ class AppManagerWidget(QWidget):
     def update_apps(self, apps):
         """Update app list display"""
         self.apps = apps
-        self.filtered_apps = apps.copy()
+        self._apps_version += 1
         self.filter_apps(self.search_input.text())
-        self.populate_table()
-        
-        count = len(apps)
-        self.status_label.setText(f"Showing {len(self.filtered_apps)} of {count} apps")
     
     def filter_apps(self, search_text):
         """Filter apps based on search text"""
+        # Skip no-op calls (same text, same app list)
+        filter_key = (search_text, self._apps_version)
+        if filter_key == self._last_filter_key:
+            return
+        self._last_filter_key = filter_key
+        
         if not search_text:
             self.filtered_apps = self.apps.copy()
         else:
             search_lower = search_text.lower()
             self.filtered_apps = [
                 app for app in self.apps
-                if search_lower in app.app_name.lower() or
-                   search_lower in app.package_name.lower()
+                if search_lower in app.name_lower or
+                   search_lower in app.package_lower
             ]
         
         self.populate_table()
@@ -228,63 +433,7 @@ class AppManagerWidget(QWidget):
     
     def populate_table(self):
         """Populate table with filtered apps"""
-        self.app_table.setRowCount(0)
-        
-        for app in self.filtered_apps:
-            row = self.app_table.rowCount()
-            self.app_table.insertRow(row)
-            
-            # App Name
-            name_item = QTableWidgetItem(app.app_name)
-            name_item.setForeground(QColor("#ffffff"))
-            self.app_table.setItem(row, 0, name_item)
-            
-            # Package
-            package_item = QTableWidgetItem(app.package_name)
-            package_item.setForeground(QColor("#999999"))
-            self.app_table.setItem(row, 1, package_item)
-            
-            # Version
-            version_item = QTableWidgetItem(app.version)
-            version_item.setForeground(QColor("#cccccc"))
-            self.app_table.setItem(row, 2, version_item)
-            
-            # Size
-            size_item = QTableWidgetItem(f"{app.size_mb} MB")
-            size_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            size_item.setForeground(QColor("#cccccc"))
-            self.app_table.setItem(row, 3, size_item)
-            
-            # Type
-            type_item = QTableWidgetItem(app.app_type)
-            if app.is_system:
-                type_item.setForeground(QColor("#ce9178"))  # Orange for system
-            else:
-                type_item.setForeground(QColor("#4ec9b0"))  # Cyan for user
-            self.app_table.setItem(row, 4, type_item)
-            
-            # Status
-            status_item = QTableWidgetItem()
-            status_item.setTextAlignment(Qt.AlignCenter)
-            
-            status_font = QFont()
-            status_font.setPointSize(9)
-            
-            if app.is_running:
-                # Green emoji for Running
-                status_item.setText("🟢 Running")
-                status_item.setForeground(QColor("#4ade80"))  # Bright green text
-                status_item.setBackground(QColor("#052e16"))  # Dark green background
-                status_font.setBold(True)
-                status_item.setFont(status_font)
-            else:
-                # Gray/Red emoji for Stopped
-                status_item.setText("⚫ Stopped")
-                status_item.setForeground(QColor("#9ca3af"))  # Gray text
-                status_item.setBackground(QColor("#1f2937"))  # Dark gray background
-                status_item.setFont(status_font)
-            
-            self.app_table.setItem(row, 5, status_item)
+        self.app_model.update_apps(self.filtered_apps)
     
     def set_device_connected(self, connected):
         """Update UI based on device connection status"""
@@ -295,5 +444,5 @@ class AppManagerWidget(QWidget):
         self.show_system_check.setEnabled(connected)
         
         if not connected:
-            self.app_table.setRowCount(0)
+            self.app_model.set_apps([])
             self.status_label.setText("No device selected")
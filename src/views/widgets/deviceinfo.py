@@ -10,21 +10,40 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Battery progress bar stylesheet per color band
+_BATTERY_STYLES = {
+    color: f"""
+            QProgressBar {{
+                border: 1px solid #555555;
+                border-radius: 3px;
+                background-color: #313335;
+            }}
+            QProgressBar::chunk {{
+                background-color: {color};
+                border-radius: 2px;
+            }}
+        """
+    for color in ("#4CAF50", "#FFC107", "#F44336")
+}
+
 
 class InfoLabel(QWidget):
     """Custom widget for displaying label-value pairs"""
     
+    _LABEL_CSS = "color: #888; font-weight: bold;"
+    _VALUE_CSS = "color: #bbbbbb;"
+    
     def __init__(self, label, value="", parent=None):
         super().__init__(parent)
         layout = QHBoxLayout()
         layout.setContentsMargins(5, 2, 5, 2)
         
         self.label = QLabel(f"{label}:")
-        self.label.setStyleSheet("color: #888; font-weight: bold;")
+        self.label.setStyleSheet(InfoLabel._LABEL_CSS)
         self.label.setMinimumWidth(120)
         
         self.value_label = QLabel(value)
-        self.value_label.setStyleSheet("color: #bbbbbb;")
+        self.value_label.setStyleSheet(InfoLabel._VALUE_CSS)
         self.value_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
         
         layout.addWidget(self.label)
@@ -32,8 +51,10 @@ class InfoLabel(QWidget):
         self.setLayout(layout)
     
     def set_value(self, value):
-        """Update the value"""
-        self.value_label.setText(str(value))
+        """Update the value (no-op if unchanged, avoiding a repaint)"""
+        text = str(value)
+        if text != self.value_label.text():
+            self.value_label.setText(text)
 
 
 class DeviceInfoWidget(QWidget):
@@ -44,6 +65,7 @@ class DeviceInfoWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_device_info = None
+        self._battery_color = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -145,9 +167,9 @@ class DeviceInfoWidget(QWidget):
         battery_label_layout = QHBoxLayout()
         
         self.battery_label = QLabel("Battery Level:")
-        self.battery_label.setStyleSheet("color: #888; font-weight: bold;")
+        self.battery_label.setStyleSheet(InfoLabel._LABEL_CSS)
         self.battery_value = QLabel("0%")
-        self.battery_value.setStyleSheet("color: #bbbbbb;")
+        self.battery_value.setStyleSheet(InfoLabel._VALUE_CSS)
         
         battery_label_layout.addWidget(self.battery_label)
         battery_label_layout.addWidget(self.battery_value)
@@ -188,39 +210,46 @@ class DeviceInfoWidget(QWidget):
         
         self.current_device_info = device_info
         
-        # Device Details
-        self.model_info.set_value(device_info.model)
-        self.manufacturer_info.set_value(device_info.manufacturer)
-        self.serial_info.set_value(device_info.serial)
-        self.connection_info.set_value(device_info.connection_type)
-        
-        if device_info.ip_address:
-            self.ip_info.set_value(device_info.ip_address)
-            self.ip_info.show()
-        else:
-            self.ip_info.hide()
-        
-        # System Info
-        self.android_version_info.set_value(device_info.android_version)
-        self.sdk_version_info.set_value(device_info.sdk_version)
-        
-        # Hardware Info
-        self.screen_resolution_info.set_value(device_info.screen_resolution)
-        
-        # Battery Info
-        self.update_battery_level(device_info.battery_level)
-        
-        # Enable all groups
-        self.device_details_group.setEnabled(True)
-        self.system_info_group.setEnabled(True)
-        self.hardware_info_group.setEnabled(True)
-        self.battery_info_group.setEnabled(True)
-        
-        logger.info(f"Updated device info for {device_info.model}")
+        self.setUpdatesEnabled(False)
+        try:
+            # Device Details
+            self.model_info.set_value(device_info.model)
+            self.manufacturer_info.set_value(device_info.manufacturer)
+            self.serial_info.set_value(device_info.serial)
+            self.connection_info.set_value(device_info.connection_type)
+            
+            if device_info.ip_address:
+                self.ip_info.set_value(device_info.ip_address)
+                self.ip_info.show()
+            else:
+                self.ip_info.hide()
+            
+            # System Info
+            self.android_version_info.set_value(device_info.android_version)
+            self.sdk_version_info.set_value(device_info.sdk_version)
+            
+            # Hardware Info
+            self.screen_resolution_info.set_value(device_info.screen_resolution)
+            
+            # Battery Info
+            self.update_battery_level(device_info.battery_level)
+            
+            # Enable all groups
+            self.device_details_group.setEnabled(True)
+            self.system_info_group.setEnabled(True)
+            self.hardware_info_group.setEnabled(True)
+            self.battery_info_group.setEnabled(True)
+            
+            logger.info(f"Updated device info for {device_info.model}")
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
     
     def update_battery_level(self, level):
         """Update battery level display"""
-        self.battery_value.setText(f"{level}%")
+        level_text = f"{level}%"
+        if level_text != self.battery_value.text():
+            self.battery_value.setText(level_text)
         self.battery_progress.setValue(level)
         
         # Color coding
@@ -231,17 +260,11 @@ class DeviceInfoWidget(QWidget):
         else:
             color = "#F44336"  # Red
         
-        self.battery_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid #555555;
-                border-radius: 3px;
-                background-color: #313335;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 2px;
-            }}
-        """)
+        # Only restyle when the color band changes
+        if color == self._battery_color:
+            return
+        self._battery_color = color
+        self.battery_progress.setStyleSheet(_BATTERY_STYLES[color])
     
     def update_extended_info(self, extended_info):
         """
@@ -253,57 +276,67 @@ class DeviceInfoWidget(QWidget):
         if not extended_info:
             return
         
-        # Update fields that weren't in basic device info
-        if 'build_number' in extended_info:
-            self.build_info.set_value(extended_info['build_number'])
-        
-        if 'security_patch' in extended_info:
-            self.security_patch_info.set_value(extended_info['security_patch'])
-        
-        if 'cpu' in extended_info:
-            self.cpu_info.set_value(extended_info['cpu'])
-        
-        if 'ram_total' in extended_info:
-            self.ram_info.set_value(extended_info['ram_total'])
-        
-        if 'storage_total' in extended_info:
-            self.storage_info.set_value(extended_info['storage_total'])
-        
-        if 'battery_status' in extended_info:
-            self.battery_status_info.set_value(extended_info['battery_status'])
-        
-        if 'battery_health' in extended_info:
-            self.battery_health_info.set_value(extended_info['battery_health'])
-        
-        if 'battery_temp' in extended_info:
-            temp_c = extended_info['battery_temp']
-            self.battery_temp_info.set_value(f"{temp_c}°C")
+        self.setUpdatesEnabled(False)
+        try:
+            # Update fields that weren't in basic device info
+            if 'build_number' in extended_info:
+                self.build_info.set_value(extended_info['build_number'])
+            
+            if 'security_patch' in extended_info:
+                self.security_patch_info.set_value(extended_info['security_patch'])
+            
+            if 'cpu' in extended_info:
+                self.cpu_info.set_value(extended_info['cpu'])
+            
+            if 'ram_total' in extended_info:
+                self.ram_info.set_value(extended_info['ram_total'])
+            
+            if 'storage_total' in extended_info:
+                self.storage_info.set_value(extended_info['storage_total'])
+            
+            if 'battery_status' in extended_info:
+                self.battery_status_info.set_value(extended_info['battery_status'])
+            
+            if 'battery_health' in extended_info:
+                self.battery_health_info.set_value(extended_info['battery_health'])
+            
+            if 'battery_temp' in extended_info:
+                temp_c = extended_info['battery_temp']
+                self.battery_temp_info.set_value(f"{temp_c}°C")
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
     
     def show_no_device(self):
         """Show no device selected state"""
-        self.model_info.set_value("No device selected")
-        self.manufacturer_info.set_value("-")
-        self.serial_info.set_value("-")
-        self.connection_info.set_value("-")
-        self.ip_info.hide()
-        
-        self.android_version_info.set_value("-")
-        self.sdk_version_info.set_value("-")
-        self.build_info.set_value("-")
-        self.security_patch_info.set_value("-")
-        
-        self.screen_resolution_info.set_value("-")
-        self.cpu_info.set_value("-")
-        self.ram_info.set_value("-")
-        self.storage_info.set_value("-")
-        
-        self.update_battery_level(0)
-        self.battery_status_info.set_value("-")
-        self.battery_health_info.set_value("-")
-        self.battery_temp_info.set_value("-")
-        
-        # Disable groups
-        self.device_details_group.setEnabled(False)
-        self.system_info_group.setEnabled(False)
-        self.hardware_info_group.setEnabled(False)
-        self.battery_info_group.setEnabled(False)
+        self.setUpdatesEnabled(False)
+        try:
+            self.model_info.set_value("No device selected")
+            self.manufacturer_info.set_value("-")
+            self.serial_info.set_value("-")
+            self.connection_info.set_value("-")
+            self.ip_info.hide()
+            
+            self.android_version_info.set_value("-")
+            self.sdk_version_info.set_value("-")
+            self.build_info.set_value("-")
+            self.security_patch_info.set_value("-")
+            
+            self.screen_resolution_info.set_value("-")
+            self.cpu_info.set_value("-")
+            self.ram_info.set_value("-")
+            self.storage_info.set_value("-")
+            
+            self.update_battery_level(0)
+            self.battery_status_info.set_value("-")
+            self.battery_health_info.set_value("-")
+            self.battery_temp_info.set_value("-")
+            
+            # Disable groups
+            self.device_details_group.setEnabled(False)
+            self.system_info_group.setEnabled(False)
+            self.hardware_info_group.setEnabled(False)
+            self.battery_info_group.setEnabled(False)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
@@ -140,25 +140,32 @@ class DevicePanel(QWidget):
         self.current_devices = devices
         current_serial = self.device_combo.currentData()
         
-        # Clear and repopulate
+        # Clear and repopulate without per-item selection signals
+        self.device_combo.blockSignals(True)
         self.device_combo.clear()
         
-        if not devices:
-            self.status_label.setText("No devices connected")
-            self.status_label.setStyleSheet("color: #888;")
-            self.disconnect_btn.setEnabled(False)
-            return
-        
         # Add devices to combo box
+        index_by_serial = {}
         for device in devices:
             display_text = f"{device.display_name} ({device.serial})"
+            index_by_serial[device.serial] = self.device_combo.count()
             self.device_combo.addItem(display_text, device.serial)
         
         # Restore previous selection if still available
-        if current_serial:
-            index = self.device_combo.findData(current_serial)
-            if index >= 0:
-                self.device_combo.setCurrentIndex(index)
+        if current_serial in index_by_serial:
+            self.device_combo.setCurrentIndex(index_by_serial[current_serial])
+        
+        self.device_combo.blockSignals(False)
+        
+        if not devices:
+            self.status_label.setText("No devices connected")
+            self.status_label.setStyleSheet("color: #888;")
+            self.disconnect_btn.setEnabled(False)
+            return
+        
+        # Notify once if the selection changed
+        if self.device_combo.currentData() != current_serial:
+            self.on_device_selected(self.device_combo.currentText())
         
         # Update status
         count = len(devices)
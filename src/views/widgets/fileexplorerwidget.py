@@ -1,19 +1,536 @@
 """File explorer widget with dual-pane file browser"""
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTreeView,
     QPushButton, QLabel, QLineEdit, QSplitter, QMenu, QFileDialog,
     QMessageBox, QInputDialog, QCheckBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QAbstractItemModel, QModelIndex, QObject, QRunnable, QThreadPool
+)
 from PyQt5.QtGui import QIcon, QColor, QFont
 import logging
 import os
+import posixpath
+from functools import lru_cache
 
 from utils.style_loader import load_stylesheet
 
 logger = logging.getLogger(__name__)
 
+_TREE_STYLE = load_stylesheet('tree_style.qss')
+_HEADER_CSS = "padding: 5px; background-color: #2d2d30;"
+
+# Cell colors (parsed once, shared by every row)
+_FG_FOLDER = QColor("#60a5fa")  # Blue for folders
+_FG_SYMLINK = QColor("#9cdcfe")  # Light blue for symlinks
+_FG_IMAGE = QColor("#f59e0b")  # Orange for images and archives
+_FG_VIDEO = QColor("#ec4899")  # Pink for videos
+_FG_AUDIO = QColor("#8b5cf6")  # Purple for audio
+_FG_APK = QColor("#10b981")  # Green for APK
+_FG_FILE = QColor("#d1d5db")  # Light gray for files
+_FG_LOCAL_FILE = QColor("#cccccc")
+_FG_SIZE = QColor("#9ca3af")
+_FG_TYPE = QColor("#6b7280")
+_FG_PERMS = QColor("#4b5563")
+
+_MENU_QSS = """
+    QMenu {
+        background-color: #2d2d30;
+        color: #cccccc;
+        border: 1px solid #3e3e42;
+    }
+    QMenu::item { padding: 6px 20px; }
+    QMenu::item:selected { background-color: #094771; }
+"""
+
+
+# File extension -> (name icon, name color)
+_EXT_TABLE = {
+    ext: (icon, color)
+    for icon, color, exts in (
+        ("🖼️", _FG_IMAGE, ('.jpg', '.png', '.gif', '.bmp')),
+        ("🎬", _FG_VIDEO, ('.mp4', '.avi', '.mkv', '.mov')),
+        ("🎵", _FG_AUDIO, ('.mp3', '.wav', '.flac')),
+        ("📦", _FG_APK, ('.apk',)),
+        ("📚", _FG_IMAGE, ('.zip', '.rar', '.7z', '.tar', '.gz')),  # Archives
+    )
+    for ext in exts
+}
+_FILE_ICON_COLOR = ("📄", _FG_FILE)
+_FOLDER_ICON_COLOR = ("📁", _FG_FOLDER)
+_SYMLINK_ICON_COLOR = ("🔗", _FG_SYMLINK)
+
+
+def _device_icon_color(file_item):
+    """
+    Get the name icon and color for a device file
+    
+    Args:
+        file_item: FileItem object
+        
+    Returns:
+        Tuple of (icon, QColor)
+    """
+    if file_item.is_directory:
+        return _SYMLINK_ICON_COLOR if file_item.is_symlink else _FOLDER_ICON_COLOR
+    
+    name = file_item.name
+    dot = name.rfind('.')
+    if dot == -1:
+        return _FILE_ICON_COLOR
+    return _EXT_TABLE.get(name[dot:].lower(), _FILE_ICON_COLOR)
+
+
+class _FlatFileModel(QAbstractItemModel):
+    """Base for single-level file listings stored as per-column lists"""
+    
+    HEADERS = []
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.names = []
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+    
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class _ChildList:
+    """Children of one expanded device directory"""
+    
+    __slots__ = ('path', 'parent_list', 'row', 'items')
+    
+    def __init__(self, path, parent_list, row):
+        self.path = path
+        self.parent_list = parent_list  # None for top-level directories
+        self.row = row  # Row of the directory within its parent
+        self.items = []
+
+
+_LOADING = object()  # Placeholder row while children are being fetched
+_LOADING_TEXT = "⏳ Loading…"
+
+
+class DeviceFileModel(_FlatFileModel):
+    """
+    Device directory listing; display values are built in data() on demand
+    
+    Top-level rows are the current directory. Directory rows can be
+    expanded: their children are requested through
+    fetch_children_requested on first expand and delivered with
+    set_children().
+    """
+    
+    HEADERS = ["Name", "Size", "Type", "Permissions"]
+    DISPLAY_CACHE_SIZE = 2048  # Roughly a few screens of cells
+    
+    fetch_children_requested = pyqtSignal(str)  # directory path
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sizes = []
+        self.types = []
+        self.perms = []
+        self.is_dir = []
+        self.file_refs = []
+        self.fetched = set()  # Directory paths already requested
+        self._children = {}  # Directory path -> _ChildList
+        self._by_path = {}  # Top-level file path -> row
+        self._italic_font = QFont()
+        self._italic_font.setItalic(True)
+        
+        # Recently painted cells, keyed by (child_list, row, column);
+        # cleared whenever rows change
+        self._display_text = lru_cache(maxsize=self.DISPLAY_CACHE_SIZE)(self._build_display_text)
+    
+    def set_rows(self, files):
+        """
+        Replace listed files
+        
+        Args:
+            files: List of FileItem objects
+        """
+        self.beginResetModel()
+        self.names = [f.name for f in files]
+        self.sizes = [f.size_formatted if not f.is_directory else "" for f in files]
+        self.types = [f.file_type for f in files]
+        self.perms = [f.permissions for f in files]
+        self.is_dir = [f.is_directory for f in files]
+        self.file_refs = list(files)
+        self._by_path = {f.path: row for row, f in enumerate(self.file_refs)}
+        self.fetched.clear()
+        self._children.clear()
+        self._display_text.cache_clear()
+        self.endResetModel()
+    
+    def rename_row(self, old_path, new_name):
+        """
+        Rename a top-level row in place
+        
+        Args:
+            old_path: Current path of the file
+            new_name: New file name (same directory)
+            
+        Returns:
+            True if the row was updated, False if the caller should reload
+            (unknown path, an expanded directory whose children would keep
+            stale paths, a hidden dot-name, or a name that moves the row)
+        """
+        row = self._by_path.get(old_path)
+        if row is None or old_path in self.fetched or new_name.startswith('.'):
+            return False
+        
+        # Rows follow FileManager.list_directory order: directories first,
+        # then by lowercased name
+        key = (not self.is_dir[row], new_name.lower())
+        if row > 0 and (not self.is_dir[row - 1], self.names[row - 1].lower()) > key:
+            return False
+        if row + 1 < len(self.names) and key > (not self.is_dir[row + 1], self.names[row + 1].lower()):
+            return False
+        
+        file_item = self.file_refs[row]
+        file_item.name = new_name
+        file_item.path = posixpath.join(posixpath.dirname(old_path), new_name)
+        
+        del self._by_path[old_path]
+        self._by_path[file_item.path] = row
+        self.names[row] = new_name
+        self.types[row] = file_item.file_type
+        self._display_text.cache_clear()
+        
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+        return True
+    
+    def set_children(self, path, files):
+        """
+        Replace the loading placeholder of an expanded directory
+        
+        Args:
+            path: Directory path passed to fetch_children_requested
+            files: List of FileItem objects inside it
+        """
+        child_list = self._children.get(path)
+        if child_list is None:
+            return  # Model was reset since the request
+        
+        parent = self.createIndex(child_list.row, 0, child_list.parent_list)
+        if child_list.items:
+            self.beginRemoveRows(parent, 0, len(child_list.items) - 1)
+            child_list.items = []
+            self._display_text.cache_clear()
+            self.endRemoveRows()
+        
+        if files:
+            self.beginInsertRows(parent, 0, len(files) - 1)
+            child_list.items = list(files)
+            self._display_text.cache_clear()
+            self.endInsertRows()
+    
+    def _file_at(self, index):
+        """Get the FileItem (or _LOADING) behind an index"""
+        child_list = index.internalPointer()
+        if child_list is None:
+            return self.file_refs[index.row()]
+        return child_list.items[index.row()]
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column)
+        return self.createIndex(row, column, self._children[self._file_at(parent).path])
+    
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        child_list = index.internalPointer()
+        if child_list is None:
+            return QModelIndex()
+        return self.createIndex(child_list.row, 0, child_list.parent_list)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.names)
+        if parent.column() != 0:
+            return 0
+        
+        file_item = self._file_at(parent)
+        if file_item is _LOADING:
+            return 0
+        child_list = self._children.get(file_item.path)
+        return len(child_list.items) if child_list else 0
+    
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self.names)
+        if parent.column() != 0:
+            return False
+        
+        file_item = self._file_at(parent)
+        return file_item is not _LOADING and file_item.is_directory
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        if not self.hasChildren(parent) or not parent.isValid():
+            return False
+        return self._file_at(parent).path not in self.fetched
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Show a placeholder and request the directory's children"""
+        if not self.canFetchMore(parent):
+            return
+        
+        path = self._file_at(parent).path
+        self.fetched.add(path)
+        child_list = _ChildList(path, parent.internalPointer(), parent.row())
+        self._children[path] = child_list
+        
+        self.beginInsertRows(parent, 0, 0)
+        child_list.items = [_LOADING]
+        self.endInsertRows()
+        
+        self.fetch_children_requested.emit(path)
+    
+    def _build_display_text(self, child_list, row, column):
+        """
+        Build the display string of one cell
+        
+        Args:
+            child_list: _ChildList of the row, or None for top-level rows
+            row: Row within that list
+            column: Column number
+        """
+        if child_list is None:
+            file_item = self.file_refs[row]
+            name = self.names[row]
+        else:
+            file_item = child_list.items[row]
+            if file_item is _LOADING:
+                return _LOADING_TEXT if column == 0 else None
+            name = file_item.name
+        
+        if column == 0:
+            icon, _ = _device_icon_color(file_item)
+            return f"{icon} {name}"
+        if child_list is None:
+            if column == 1:
+                return self.sizes[row]
+            if column == 2:
+                return self.types[row]
+            return self.perms[row]
+        if column == 1:
+            return "" if file_item.is_directory else file_item.size_formatted
+        if column == 2:
+            return file_item.file_type
+        return file_item.permissions
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        column = index.column()
+        child_list = index.internalPointer()
+        
+        # Display strings are memoized; all other roles are cheap lookups
+        if role == Qt.DisplayRole:
+            return self._display_text(child_list, row, column)
+        
+        if child_list is None:
+            file_item = self.file_refs[row]
+            name = self.names[row]
+        else:
+            file_item = child_list.items[row]
+            if file_item is _LOADING:
+                return None
+            name = file_item.name
+        
+        if role == Qt.ForegroundRole:
+            if column == 0:
+                _, color = _device_icon_color(file_item)
+                return color
+            if column == 1:
+                return _FG_SIZE
+            if column == 2:
+                return _FG_TYPE
+            return _FG_PERMS
+        
+        # Make hidden files slightly italic
+        if role == Qt.FontRole and column == 0 and name.startswith('.'):
+            return self._italic_font
+        
+        if role == Qt.TextAlignmentRole and column == 1:
+            return Qt.AlignRight | Qt.AlignVCenter
+        
+        if role == Qt.UserRole:
+            return file_item
+        
+        return None
+
+
+class LocalFileModel(_FlatFileModel):
+    """Local directory listing"""
+    
+    HEADERS = ["Name", "Size", "Type"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.paths = []
+        self.sizes = []
+        self.types = []
+        self.is_dir = []
+    
+    def set_rows(self, rows):
+        """
+        Replace listed entries
+        
+        Args:
+            rows: List of (name, path, size_str, type_str, is_dir) tuples
+        """
+        self.beginResetModel()
+        self.names = [r[0] for r in rows]
+        self.paths = [r[1] for r in rows]
+        self.sizes = [r[2] for r in rows]
+        self.types = [r[3] for r in rows]
+        self.is_dir = [r[4] for r in rows]
+        self.endResetModel()
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return f"{'📁' if self.is_dir[row] else '📄'} {self.names[row]}"
+            if column == 1:
+                return self.sizes[row]
+            return self.types[row]
+        
+        if role == Qt.ForegroundRole and column == 0:
+            return _FG_FOLDER if self.is_dir[row] else _FG_LOCAL_FILE
+        
+        if role == Qt.TextAlignmentRole and column == 1:
+            return Qt.AlignRight | Qt.AlignVCenter
+        
+        if role == Qt.UserRole:
+            return self.paths[row]
+        
+        return None
+
+
+_SIZE_SUFFIXES = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+def _format_size(size):
+    """
+    Format a byte count for display
+    
+    Args:
+        size: Size in bytes
+        
+    Returns:
+        Size string such as "512 B" or "1.5 MB"
+    """
+    # Pick the unit with shifts; only the final value needs a division
+    unit = 0
+    scaled = size
+    while scaled >= 1024 and unit < len(_SIZE_SUFFIXES) - 1:
+        scaled >>= 10
+        unit += 1
+    
+    if unit == 0:
+        return f"{size} B"
+    return f"{round(size / (1 << (10 * unit)), 2)} {_SIZE_SUFFIXES[unit]}"
+
+
+def _scan_local_dir(path):
+    """
+    List a local directory (runs off the UI thread)
+    
+    Args:
+        path: Local directory path
+        
+    Returns:
+        List of (name, path, size_str, type_str, is_dir) tuples,
+        directories first
+    """
+    # Sort: directories first
+    dirs = []
+    files = []
+    
+    # One directory read; DirEntry caches type and stat data
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir():
+                dirs.append((entry.name, entry.path))
+                continue
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                size = None  # e.g. broken symlink
+            files.append((entry.name, entry.path, size))
+    
+    dirs.sort(key=lambda x: x[0].lower())
+    files.sort(key=lambda x: x[0].lower())
+    
+    rows = [(name, path, "", "", True) for name, path in dirs]
+    
+    for name, path, size in files:
+        size_str = "" if size is None else _format_size(size)
+        
+        # Type
+        if '.' in name:
+            ext = name.split('.')[-1].upper()
+            type_str = f"{ext} File"
+        else:
+            type_str = "File"
+        
+        rows.append((name, path, size_str, type_str, False))
+    
+    return rows
+
+
+class _LocalScanSignals(QObject):
+    """Signals for _LocalScanTask (QRunnable is not a QObject)"""
+    
+    finished = pyqtSignal(int, str, list)  # generation, path, rows
+    error = pyqtSignal(int, str)  # generation, message
+
+
+class _LocalScanTask(QRunnable):
+    """Background local directory listing"""
+    
+    def __init__(self, generation, path, signals):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.signals = signals
+    
+    def run(self):
+        try:
+            rows = _scan_local_dir(self.path)
+            self.signals.finished.emit(self.generation, self.path, rows)
+        except Exception as e:
+            self.signals.error.emit(self.generation, str(e))
+
 
 class FileExplorerWidget(QWidget):
     """File explorer with device and local file browsers"""
@@ -26,11 +543,20 @@ class FileExplorerWidget(QWidget):
     rename_requested = pyqtSignal(str, str)  # old_path, new_path
     create_folder_requested = pyqtSignal(str)  # path
     show_hidden_changed = pyqtSignal(bool)
+    children_requested = pyqtSignal(str)  # Expanded device directory path
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_device_path = "/sdcard"
         self.current_local_path = os.path.expanduser("~")
+        self._dir_dialog = None
+        
+        # Local listings run on the thread pool; stale results are dropped
+        self._scan_gen = 0
+        self._scan_signals = _LocalScanSignals(self)
+        self._scan_signals.finished.connect(self._on_local_scan_done)
+        self._scan_signals.error.connect(self._on_local_scan_failed)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -73,7 +599,7 @@ class FileExplorerWidget(QWidget):
         header_font.setBold(True)
         header_font.setPointSize(10)
         header.setFont(header_font)
-        header.setStyleSheet("padding: 5px; background-color: #2d2d30;")
+        header.setStyleSheet(_HEADER_CSS)
         layout.addWidget(header)
         
         # Quick access bookmarks with Show Hidden toggle
@@ -98,7 +624,8 @@ class FileExplorerWidget(QWidget):
             btn.setMaximumWidth(70)  # REDUCED from 100
             btn.setMaximumHeight(25)  # ADD height limit
             btn.setStyleSheet("font-size: 8pt; padding: 2px 4px;")  # ADD smaller font
-            btn.clicked.connect(lambda checked, p=path: self.navigate_to_path(p))
+            btn.setProperty('nav_path', path)
+            btn.clicked.connect(self._on_bookmark_clicked)
             bookmarks_layout.addWidget(btn)
         
         bookmarks_layout.addStretch()
@@ -135,17 +662,21 @@ class FileExplorerWidget(QWidget):
         layout.addLayout(path_layout)
         
         # File tree
-        self.device_tree = QTreeWidget()
-        self.device_tree.setHeaderLabels(["Name", "Size", "Type", "Permissions"])
+        self.device_model = DeviceFileModel(self)
+        self.device_model.fetch_children_requested.connect(self.children_requested)
+        self.device_tree = QTreeView()
+        self.device_tree.setModel(self.device_model)
         self.device_tree.setAlternatingRowColors(True)
+        self.device_tree.setUniformRowHeights(True)  # Skip per-row height queries
+        self.device_tree.setAnimated(False)
+        self.device_tree.setExpandsOnDoubleClick(False)  # Double-click navigates
         self.device_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.device_tree.customContextMenuRequested.connect(self.show_device_context_menu)
-        self.device_tree.itemDoubleClicked.connect(self.on_device_item_double_clicked)
+        self.device_tree.doubleClicked.connect(self.on_device_item_double_clicked)
         
         # Apply tree stylesheet
-        tree_style = load_stylesheet('tree_style.qss')  # Reuse table style
-        if tree_style:
-            self.device_tree.setStyleSheet(tree_style)
+        if _TREE_STYLE:
+            self.device_tree.setStyleSheet(_TREE_STYLE)
         
         # Set column widths
         self.device_tree.setColumnWidth(0, 250)
@@ -187,7 +718,7 @@ class FileExplorerWidget(QWidget):
         header_font.setBold(True)
         header_font.setPointSize(10)
         header.setFont(header_font)
-        header.setStyleSheet("padding: 5px; background-color: #2d2d30;")
+        header.setStyleSheet(_HEADER_CSS)
         layout.addWidget(header)
         
         # Path navigation
@@ -213,15 +744,18 @@ class FileExplorerWidget(QWidget):
         layout.addLayout(path_layout)
         
         # File tree
-        self.local_tree = QTreeWidget()
-        self.local_tree.setHeaderLabels(["Name", "Size", "Type"])
+        self.local_model = LocalFileModel(self)
+        self.local_tree = QTreeView()
+        self.local_tree.setModel(self.local_model)
         self.local_tree.setAlternatingRowColors(True)
-        self.local_tree.itemDoubleClicked.connect(self.on_local_item_double_clicked)
+        self.local_tree.setUniformRowHeights(True)  # Skip per-row height queries
+        self.local_tree.setAnimated(False)
+        self.local_tree.setExpandsOnDoubleClick(False)  # Double-click navigates
+        self.local_tree.doubleClicked.connect(self.on_local_item_double_clicked)
         
         # Apply tree stylesheet
-        tree_style = load_stylesheet('tree_style.qss')
-        if tree_style:
-            self.local_tree.setStyleSheet(tree_style)
+        if _TREE_STYLE:
+            self.local_tree.setStyleSheet(_TREE_STYLE)
         
         # Set column widths
         self.local_tree.setColumnWidth(0, 250)
@@ -256,7 +790,7 @@ class FileExplorerWidget(QWidget):
     def on_device_up_clicked(self):
         """Navigate up in device directory"""
         if self.current_device_path != "/":
-            parent = os.path.dirname(self.current_device_path)
+            parent = posixpath.dirname(self.current_device_path)
             if not parent:
                 parent = "/"
             self.current_device_path = parent
@@ -272,12 +806,15 @@ class FileExplorerWidget(QWidget):
     
     def on_browse_local_clicked(self):
         """Browse for local directory"""
-        path = QFileDialog.getExistingDirectory(
-            self,
-            "Select Directory",
-            self.current_local_path
-        )
-        if path:
+        # Created once and reused for every browse
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(self, "Select Directory")
+            self._dir_dialog.setFileMode(QFileDialog.Directory)
+            self._dir_dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        
+        self._dir_dialog.setDirectory(self.current_local_path)
+        if self._dir_dialog.exec_():
+            path = self._dir_dialog.selectedFiles()[0]
             self.current_local_path = path
             self.local_path_input.setText(path)
             self.refresh_local_files()
@@ -290,18 +827,17 @@ class FileExplorerWidget(QWidget):
             self.local_path_input.setText(parent)
             self.refresh_local_files()
     
-    def on_device_item_double_clicked(self, item, column):
+    def on_device_item_double_clicked(self, index):
         """Handle double-click on device item"""
-        if item.data(0, Qt.UserRole):  # Check if it's a directory
-            file_item = item.data(0, Qt.UserRole + 1)
-            if file_item.is_directory:
-                self.current_device_path = file_item.path
-                self.device_path_input.setText(file_item.path)
-                self.path_changed.emit(file_item.path)
-    
-    def on_local_item_double_clicked(self, item, column):
+        file_item = index.data(Qt.UserRole)
+        if file_item and file_item.is_directory:
+            self.current_device_path = file_item.path
+            self.device_path_input.setText(file_item.path)
+            self.path_changed.emit(file_item.path)
+    
+    def on_local_item_double_clicked(self, index):
         """Handle double-click on local item"""
-        path = item.data(0, Qt.UserRole)
+        path = index.data(Qt.UserRole)
         if path and os.path.isdir(path):
             self.current_local_path = path
             self.local_path_input.setText(path)
@@ -309,24 +845,16 @@ class FileExplorerWidget(QWidget):
     
     def show_device_context_menu(self, position):
         """Show context menu for device files"""
-        item = self.device_tree.itemAt(position)
-        if not item:
+        index = self.device_tree.indexAt(position)
+        if not index.isValid():
             return
         
-        file_item = item.data(0, Qt.UserRole + 1)
+        file_item = index.data(Qt.UserRole)
         if not file_item:
             return
         
         menu = QMenu()
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2d2d30;
-                color: #cccccc;
-                border: 1px solid #3e3e42;
-            }
-            QMenu::item { padding: 6px 20px; }
-            QMenu::item:selected { background-color: #094771; }
-        """)
+        menu.setStyleSheet(_MENU_QSS)
         
         download_action = menu.addAction("⬇ Download")
         rename_action = menu.addAction("✏️ Rename")
@@ -350,25 +878,25 @@ class FileExplorerWidget(QWidget):
         )
         
         if ok and name:
-            new_path = f"{self.current_device_path}/{name}"
+            new_path = posixpath.join(self.current_device_path, name)
             self.create_folder_requested.emit(new_path)
     
     def on_download_clicked(self):
         """Download selected file"""
-        selected = self.device_tree.selectedItems()
+        selected = self.device_tree.selectionModel().selectedRows()
         if selected:
-            file_item = selected[0].data(0, Qt.UserRole + 1)
+            file_item = selected[0].data(Qt.UserRole)
             if file_item:
                 self.download_file(file_item)
     
     def on_upload_clicked(self):
         """Upload selected file"""
-        selected = self.local_tree.selectedItems()
+        selected = self.local_tree.selectionModel().selectedRows()
         if selected:
-            local_path = selected[0].data(0, Qt.UserRole)
+            local_path = selected[0].data(Qt.UserRole)
             if local_path and os.path.isfile(local_path):
                 filename = os.path.basename(local_path)
-                remote_path = f"{self.current_device_path}/{filename}"
+                remote_path = posixpath.join(self.current_device_path, filename)
                 self.upload_requested.emit(local_path, remote_path)
     
     def download_file(self, file_item):
@@ -390,8 +918,7 @@ class FileExplorerWidget(QWidget):
         )
         
         if ok and new_name:
-            parent = os.path.dirname(file_item.path)
-            new_path = f"{parent}/{new_name}"
+            new_path = posixpath.join(posixpath.dirname(file_item.path), new_name)
             self.rename_requested.emit(file_item.path, new_path)
     
     def delete_file(self, file_item):
@@ -408,139 +935,52 @@ class FileExplorerWidget(QWidget):
     
     def update_device_files(self, files):
         """Update device file tree"""
-        from PyQt5.QtGui import QFont
-        
-        self.device_tree.clear()
+        self.device_model.set_rows(files)
+        self.status_label.setText(f"Device: {len(files)} items in {self.current_device_path}")
+    
+    def update_device_children(self, path, files):
+        """
+        Fill in an expanded device directory
         
-        for file_item in files:
-            item = QTreeWidgetItem()
+        Args:
+            path: Directory path from children_requested
+            files: List of FileItem objects inside it
+        """
+        self.device_model.set_children(path, files)
 
-            # Check if hidden
-            is_hidden = file_item.name.startswith('.')
-            
-            # Name with icon and better colors
-            if file_item.is_directory:
-                if file_item.is_symlink:
-                    item.setText(0, f"🔗 {file_item.name}")
-                    item.setForeground(0, QColor("#9cdcfe"))  # Light blue for symlinks
-                else:
-                    item.setText(0, f"📁 {file_item.name}")
-                    item.setForeground(0, QColor("#60a5fa"))  # Blue for folders
-            else:
-                # Different icons based on file type
-                name = file_item.name.lower()
-                if name.endswith(('.jpg', '.png', '.gif', '.bmp')):
-                    item.setText(0, f"🖼️ {file_item.name}")
-                    item.setForeground(0, QColor("#f59e0b"))  # Orange for images
-                elif name.endswith(('.mp4', '.avi', '.mkv', '.mov')):
-                    item.setText(0, f"🎬 {file_item.name}")
-                    item.setForeground(0, QColor("#ec4899"))  # Pink for videos
-                elif name.endswith(('.mp3', '.wav', '.flac')):
-                    item.setText(0, f"🎵 {file_item.name}")
-                    item.setForeground(0, QColor("#8b5cf6"))  # Purple for audio
-                elif name.endswith(('.apk',)):
-                    item.setText(0, f"📦 {file_item.name}")
-                    item.setForeground(0, QColor("#10b981"))  # Green for APK
-                elif name.endswith(('.zip', '.rar', '.7z', '.tar', '.gz')):
-                    item.setText(0, f"📚 {file_item.name}")
-                    item.setForeground(0, QColor("#f59e0b"))  # Orange for archives
-                else:
-                    item.setText(0, f"📄 {file_item.name}")
-                    item.setForeground(0, QColor("#d1d5db"))  # Light gray for files
-
-            # Make hidden files slightly italic
-            if is_hidden:
-                font = item.font(0)
-                font.setItalic(True)
-                item.setFont(0, font)
-            
-            # Size with better formatting
-            if not file_item.is_directory:
-                item.setText(1, file_item.size_formatted)
-                item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
-                item.setForeground(1, QColor("#9ca3af"))
-            else:
-                item.setText(1, "")
-            
-            # Type
-            item.setText(2, file_item.file_type)
-            item.setForeground(2, QColor("#6b7280"))
-            
-            # Permissions
-            item.setText(3, file_item.permissions)
-            item.setForeground(3, QColor("#4b5563"))
-            
-            # Store file item data
-            item.setData(0, Qt.UserRole, file_item.is_directory)
-            item.setData(0, Qt.UserRole + 1, file_item)
-            
-            self.device_tree.addTopLevelItem(item)
+    def rename_device_item(self, old_path, new_path):
+        """
+        Apply a completed rename to the device tree without reloading
         
-        self.status_label.setText(f"Device: {len(files)} items in {self.current_device_path}")
-
+        Args:
+            old_path: Path before the rename
+            new_path: Path after the rename
+            
+        Returns:
+            True if the row was updated in place
+        """
+        return self.device_model.rename_row(old_path, posixpath.basename(new_path))
+    
     def refresh_local_files(self):
-        """Refresh local file tree"""
-        self.local_tree.clear()
+        """Refresh local file tree (listing runs on the global thread pool)"""
+        self._scan_gen += 1
+        QThreadPool.globalInstance().start(
+            _LocalScanTask(self._scan_gen, self.current_local_path, self._scan_signals)
+        )
+    
+    def _on_local_scan_done(self, generation, path, rows):
+        """Show a finished local listing unless a newer scan was started"""
+        if generation != self._scan_gen:
+            return
         
-        try:
-            entries = os.listdir(self.current_local_path)
-            
-            # Sort: directories first
-            dirs = []
-            files = []
-            
-            for entry in entries:
-                full_path = os.path.join(self.current_local_path, entry)
-                if os.path.isdir(full_path):
-                    dirs.append((entry, full_path))
-                else:
-                    files.append((entry, full_path))
-            
-            dirs.sort(key=lambda x: x[0].lower())
-            files.sort(key=lambda x: x[0].lower())
-            
-            # Add directories
-            for name, path in dirs:
-                item = QTreeWidgetItem()
-                item.setText(0, f"📁 {name}")
-                item.setForeground(0, QColor("#60a5fa"))
-                item.setData(0, Qt.UserRole, path)
-                self.local_tree.addTopLevelItem(item)
-            
-            # Add files
-            for name, path in files:
-                item = QTreeWidgetItem()
-                item.setText(0, f"📄 {name}")
-                item.setForeground(0, QColor("#cccccc"))
-                
-                # Size
-                try:
-                    size = os.path.getsize(path)
-                    if size < 1024:
-                        size_str = f"{size} B"
-                    elif size < 1024 * 1024:
-                        size_str = f"{round(size/1024, 2)} KB"
-                    else:
-                        size_str = f"{round(size/(1024*1024), 2)} MB"
-                    item.setText(1, size_str)
-                    item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
-                except:
-                    pass
-                
-                # Type
-                if '.' in name:
-                    ext = name.split('.')[-1].upper()
-                    item.setText(2, f"{ext} File")
-                else:
-                    item.setText(2, "File")
-                
-                item.setData(0, Qt.UserRole, path)
-                self.local_tree.addTopLevelItem(item)
-            
-            self.status_label.setText(f"Local: {len(entries)} items")
-            
-        except Exception as e:
-            logger.error(f"Error listing local files: {e}")
+        # Directories first, populated in one model reset
+        self.local_model.set_rows(rows)
+        self.status_label.setText(f"Local: {len(rows)} items")
+    
+    def _on_local_scan_failed(self, generation, error):
+        """Handle local listing failure"""
+        if generation == self._scan_gen:
+            logger.error(f"Error listing local files: {error}")
     
     def set_device_connected(self, connected):
         """Update UI based on device connection"""
@@ -552,7 +992,7 @@ class FileExplorerWidget(QWidget):
         self.upload_btn.setEnabled(connected)
         
         if not connected:
-            self.device_tree.clear()
+            self.device_model.set_rows([])
             self.status_label.setText("No device connected")
 
     def navigate_to_path(self, path):
@@ -566,10 +1006,12 @@ class FileExplorerWidget(QWidget):
         self.device_path_input.setText(path)
         self.path_changed.emit(path)
     
+    def _on_bookmark_clicked(self):
+        """Navigate to the path of the clicked bookmark button"""
+        self.navigate_to_path(self.sender().property('nav_path'))
+    
     def on_show_hidden_changed(self, state):
         """Handle show hidden files checkbox change"""
-        from PyQt5.QtCore import Qt
-        
         show_hidden = (state == Qt.Checked)
         logger.info(f"Show hidden files: {show_hidden}")
         
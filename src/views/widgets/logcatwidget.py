@@ -1,16 +1,34 @@
 """Logcat viewer widget"""
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton,
     QComboBox, QLineEdit, QLabel, QCheckBox, QFileDialog, QMessageBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QTextCharFormat, QColor, QFont, QTextCursor
 import logging
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+
+from models.logcatmodel import LEVEL_COLORS
 
 logger = logging.getLogger(__name__)
 
+# Level combo text -> logcat level letter
+_LEVEL_MAP = {
+    'Verbose': 'V',
+    'Debug': 'D',
+    'Info': 'I',
+    'Warning': 'W',
+    'Error': 'E',
+    'Fatal': 'F',
+}
+
+# Level letter -> text color (parsed once)
+_LEVEL_QCOLORS = {level: QColor(color) for level, color in LEVEL_COLORS.items()}
+_DEFAULT_QCOLOR = QColor('#ffffff')
+
 
 class LogcatWidget(QWidget):
     """Logcat viewer interface"""
@@ -21,12 +39,52 @@ class LogcatWidget(QWidget):
     stop_requested = pyqtSignal()
     export_requested = pyqtSignal(str)  # file_path
     
+    MAX_LOG_BLOCKS = 50000  # Oldest lines are dropped beyond this
+    FLUSH_INTERVAL_MS = 50  # Incoming lines are written at most this often
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.is_streaming = False
         self.auto_scroll = True
+        self._pending_query = ""
+        self._export_dialog = None
+        
+        # Debounce search typing into a single highlight pass
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._do_search)
+        
+        # Incoming lines are buffered and written in batches
+        self._log_buf = []  # (text, level) pairs; level None for raw lines
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_logs)
+        
+        # One shared text format per level (None: raw, unparsed lines)
+        self._level_formats = {
+            level: self._make_format(color) for level, color in _LEVEL_QCOLORS.items()
+        }
+        self._level_formats[None] = QTextCharFormat()
+        self._unknown_level_format = self._make_format(_DEFAULT_QCOLOR)
+        
+        # Search highlighting
+        self._highlight_format = QTextCharFormat()
+        self._highlight_format.setBackground(QColor("#613214"))
+        self._clear_format = QTextCharFormat()
+        self._clear_format.setBackground(QColor("#1e1e1e"))
+        self._prev_highlights = []  # Cursors selecting the highlighted matches
+        
         self.setup_ui()
     
+    @staticmethod
+    def _make_format(color):
+        """Create a text format with the given foreground color"""
+        format = QTextCharFormat()
+        format.setForeground(color)
+        return format
+    
     def setup_ui(self):
         """Setup logcat viewer UI"""
         layout = QVBoxLayout()
@@ -37,9 +95,13 @@ class LogcatWidget(QWidget):
         layout.addLayout(toolbar)
         
         # Log display
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
-        self.log_display.setLineWrapMode(QTextEdit.NoWrap)
+        self.log_display.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.log_display.document().setMaximumBlockCount(self.MAX_LOG_BLOCKS)
+        
+        # Insertion cursor kept at the end of the document between appends
+        self._end_cursor = QTextCursor(self.log_display.document())
         
         # Set monospace font
         font = QFont("Consolas", 9)
@@ -48,7 +110,7 @@ class LogcatWidget(QWidget):
         
         # Dark theme styling
         self.log_display.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #cccccc;
                 border: 1px solid #3e3e42;
@@ -121,16 +183,7 @@ class LogcatWidget(QWidget):
     
     def on_start_clicked(self):
         """Handle start button"""
-        level_map = {
-            'Verbose': 'V',
-            'Debug': 'D',
-            'Info': 'I',
-            'Warning': 'W',
-            'Error': 'E',
-            'Fatal': 'F'
-        }
-        
-        level = level_map.get(self.level_combo.currentText(), 'V')
+        level = _LEVEL_MAP.get(self.level_combo.currentText(), 'V')
         tag = self.tag_input.text().strip() or None
         
         self.is_streaming = True
@@ -151,20 +204,24 @@ class LogcatWidget(QWidget):
     
     def on_clear_clicked(self):
         """Handle clear button"""
+        self._log_buf.clear()
+        self._prev_highlights = []
         self.log_display.clear()
         self.clear_requested.emit()
         self.status_label.setText("Logs cleared")
     
     def on_export_clicked(self):
         """Handle export button"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Logs",
-            f"logcat_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-            "Text Files (*.txt);;All Files (*)"
-        )
-        
-        if file_path:
+        # Created once and reused for every export
+        if self._export_dialog is None:
+            self._export_dialog = QFileDialog(self, "Export Logs")
+            self._export_dialog.setAcceptMode(QFileDialog.AcceptSave)
+            self._export_dialog.setNameFilters(["Text Files (*.txt)", "All Files (*)"])
+        
+        self._export_dialog.selectFile(f"logcat_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+        if self._export_dialog.exec_():
+            file_path = self._export_dialog.selectedFiles()[0]
+            self._flush_logs()
             self.export_requested.emit(file_path)
     
     def on_auto_scroll_changed(self, state):
@@ -172,20 +229,30 @@ class LogcatWidget(QWidget):
         self.auto_scroll = (state == Qt.Checked)
     
     def on_search_changed(self, text):
-        """Handle search text change"""
-        # Highlight search matches
+        """Handle search text change (highlighting runs after typing pauses)"""
+        self._pending_query = text
+        self._search_timer.start()
+    
+    def _do_search(self):
+        """Highlight matches of the pending search text"""
+        text = self._pending_query
+        document = self.log_display.document()
+        
+        # Clear only the previous matches (merge keeps the level colors);
+        # cursors follow edits, so evicted lines just leave empty selections
+        for cursor in self._prev_highlights:
+            cursor.mergeCharFormat(self._clear_format)
+        self._prev_highlights = []
+        
         if not text:
-            # Clear highlighting
-            cursor = self.log_display.textCursor()
-            cursor.select(QTextCursor.Document)
-            format = QTextCharFormat()
-            format.setBackground(QColor("#1e1e1e"))
-            cursor.setCharFormat(format)
             return
         
-        # Simple search - could be improved
-        # This is a basic implementation
-        pass
+        # Case-insensitive (no find flags)
+        cursor = document.find(text)
+        while not cursor.isNull():
+            cursor.mergeCharFormat(self._highlight_format)
+            self._prev_highlights.append(cursor)
+            cursor = document.find(text, cursor)
     
     def append_log(self, log_entry):
         """
@@ -194,32 +261,38 @@ class LogcatWidget(QWidget):
         Args:
             log_entry: LogEntry object or string
         """
+        # Start a flush when the buffer goes from empty to non-empty
+        if not self._log_buf:
+            self._flush_timer.start()
+        
         # Handle string input (raw log)
         if isinstance(log_entry, str):
-            self.log_display.append(log_entry)
-            
-            # Auto-scroll
-            if self.auto_scroll:
-                cursor = self.log_display.textCursor()
-                cursor.movePosition(QTextCursor.End)
-                self.log_display.setTextCursor(cursor)
-                self.log_display.ensureCursorVisible()
+            self._log_buf.append((log_entry + '\n', None))
+        else:
+            # Color based on log level
+            self._log_buf.append((str(log_entry) + '\n', log_entry.level))
+    
+    def _flush_logs(self):
+        """Write buffered log lines, one insert per run of same-colored lines"""
+        if not self._log_buf:
             return
         
-        # Create formatted text for LogEntry object
-        cursor = self.log_display.textCursor()
-        cursor.movePosition(QTextCursor.End)
+        entries, self._log_buf = self._log_buf, []
         
-        # Set color based on log level
-        format = QTextCharFormat()
-        format.setForeground(QColor(log_entry.level_color))
+        cursor = self._end_cursor
+        if not cursor.atEnd():
+            cursor.movePosition(QTextCursor.End)
         
-        cursor.insertText(str(log_entry) + '\n', format)
+        cursor.beginEditBlock()
+        for level, group in groupby(entries, key=itemgetter(1)):
+            format = self._level_formats.get(level, self._unknown_level_format)
+            cursor.insertText(''.join(text for text, _ in group), format)
+        cursor.endEditBlock()
         
         # Auto-scroll
         if self.auto_scroll:
-            self.log_display.setTextCursor(cursor)
-            self.log_display.ensureCursorVisible()
+            scrollbar = self.log_display.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
     
     def set_device_connected(self, connected):
         """Update UI based on device connection"""
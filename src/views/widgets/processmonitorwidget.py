@@ -1,11 +1,13 @@
 """Process monitor widget"""
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
     QPushButton, QLineEdit, QLabel, QHeaderView, QMenu, QMessageBox,
     QCheckBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
 from PyQt5.QtGui import QColor, QFont
 import logging
 
@@ -13,6 +15,208 @@ from utils.style_loader import load_stylesheet
 
 logger = logging.getLogger(__name__)
 
+# Cell colors (parsed once, shared by every cell)
+_FG_PID = QColor("#9cdcfe")
+_FG_NAME = QColor("#ffffff")
+_FG_USER = QColor("#dcdcaa")
+_FG_MEM = QColor("#b5cea8")
+_FG_RUNNING = QColor("#4ec9b0")  # Green for running
+_FG_ZOMBIE = QColor("#f48771")  # Red for zombie
+_FG_STATE = QColor("#cccccc")
+_FG_CPU = QColor("#888888")
+_STATE_COLORS = {'R': _FG_RUNNING, 'Z': _FG_ZOMBIE}
+
+_ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """Table model serving ProcessInfo rows on demand"""
+    
+    HEADERS = ["PID", "Process Name", "User", "Memory (MB)", "State", "CPU %"]
+    MAX_REMOVE_RUNS = 32  # Above this, a reset is cheaper than removals
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.processes = []
+        self.haystacks = []
+        self._snapshots = []
+    
+    def set_processes(self, processes):
+        """Replace displayed processes"""
+        self.beginResetModel()
+        # One row per PID, matching update_processes' keying
+        self.processes = list({p.pid: p for p in processes}.values())
+        
+        # One lowercased search string per row, built once per refresh;
+        # NUL separators keep matches from spanning two fields
+        self.haystacks = [self._haystack(p) for p in self.processes]
+        self._snapshots = [self._snapshot(p) for p in self.processes]
+        self.endResetModel()
+    
+    def update_processes(self, processes):
+        """
+        Update displayed processes in place, keyed by PID
+        
+        Rows of exited processes are removed, rows whose values changed
+        emit dataChanged, and new processes are appended. Selection and
+        scroll position survive. Falls back to a reset when the model is
+        empty or the removals are too scattered.
+        
+        Args:
+            processes: New list of ProcessInfo objects
+        """
+        new_by_pid = {p.pid: p for p in processes}
+        
+        # Find contiguous runs of exited processes
+        runs = []
+        row = len(self.processes) - 1
+        while row >= 0:
+            if self.processes[row].pid in new_by_pid:
+                row -= 1
+                continue
+            end = row
+            while row >= 0 and self.processes[row].pid not in new_by_pid:
+                row -= 1
+            runs.append((row + 1, end))
+        
+        if not self.processes or len(runs) > self.MAX_REMOVE_RUNS:
+            self.set_processes(processes)
+            return
+        
+        # Remove bottom-up so earlier row numbers stay valid
+        for start, end in runs:
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self.processes[start:end + 1]
+            del self.haystacks[start:end + 1]
+            del self._snapshots[start:end + 1]
+            self.endRemoveRows()
+        
+        # Refresh surviving rows, signalling only those that changed
+        last_column = len(self.HEADERS) - 1
+        for row, old in enumerate(self.processes):
+            process = new_by_pid.pop(old.pid)
+            self.processes[row] = process
+            snapshot = self._snapshot(process)
+            if snapshot != self._snapshots[row]:
+                self._snapshots[row] = snapshot
+                self.haystacks[row] = self._haystack(process)
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+        
+        # Whatever is left in new_by_pid started since the last refresh
+        if new_by_pid:
+            first = len(self.processes)
+            added = list(new_by_pid.values())
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self.processes.extend(added)
+            self.haystacks.extend(self._haystack(p) for p in added)
+            self._snapshots.extend(self._snapshot(p) for p in added)
+            self.endInsertRows()
+    
+    @staticmethod
+    def _haystack(process):
+        """Lowercased search string for a process"""
+        return '\0'.join((process.name, process.pid_str, process.user)).lower()
+    
+    @staticmethod
+    def _snapshot(process):
+        """Displayed values of a process, for change detection"""
+        return (process.name, process.user, process.mem_size, process.state)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.processes)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        process = self.processes[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return process.pid_str
+            if column == 1:
+                return process.name
+            if column == 2:
+                return process.user
+            if column == 3:
+                return process.mem_str
+            if column == 4:
+                return process.state_text
+            return "N/A"  # CPU % (placeholder)
+        
+        if role == Qt.ForegroundRole:
+            if column == 0:
+                return _FG_PID
+            if column == 1:
+                return _FG_NAME
+            if column == 2:
+                return _FG_USER
+            if column == 3:
+                return _FG_MEM
+            if column == 4:
+                return _STATE_COLORS.get(process.state, _FG_STATE)
+            return _FG_CPU
+        
+        if role == Qt.TextAlignmentRole:
+            if column == 4:
+                return Qt.AlignCenter
+            if column in (0, 3, 5):
+                return _ALIGN_RIGHT
+        
+        return None
+
+
+class ProcessFilterProxyModel(QSortFilterProxyModel):
+    """Sorts process rows and filters them by name, PID or user"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search = ""
+    
+    def set_search_text(self, text):
+        """
+        Set the search text and re-filter
+        
+        Returns:
+            True if the filter changed
+        """
+        search = text.lower()
+        if search == self._search:
+            return False
+        
+        self._search = search
+        self.invalidateFilter()
+        return True
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        search = self._search
+        if not search:
+            return True
+        
+        return search in self.sourceModel().haystacks[source_row]
+    
+    def lessThan(self, left, right):
+        # PID and memory compare as numbers straight from the model's
+        # list, not as display strings ("10" < "9")
+        column = left.column()
+        if column == 0 or column == 3:
+            processes = self.sourceModel().processes
+            a = processes[left.row()]
+            b = processes[right.row()]
+            if column == 0:
+                return a.pid < b.pid
+            return a.mem_size < b.mem_size
+        return super().lessThan(left, right)
+
 
 class ProcessMonitorWidget(QWidget):
     """Process monitoring interface"""
@@ -22,12 +226,21 @@ class ProcessMonitorWidget(QWidget):
     kill_requested = pyqtSignal(int)  # PID
     force_kill_requested = pyqtSignal(int)  # PID
     
+    COLUMN_WIDTHS = {0: 70, 2: 100, 3: 100, 4: 90, 5: 60}  # px; Name stretches
+    
     def __init__(self, parent=None):
         super().__init__()
         self.processes = []
-        self.filtered_processes = []
         self.auto_refresh_timer = QTimer()
         self.auto_refresh_timer.timeout.connect(self.on_auto_refresh)
+        self._was_auto = False  # Timer was running when the widget was hidden
+        
+        # Debounce search typing into a single filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self.filter_processes(self.search_input.text()))
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -36,23 +249,23 @@ class ProcessMonitorWidget(QWidget):
         layout.setContentsMargins(5, 5, 5, 5)
         
         # Create process table FIRST (before toolbar)
-        self.process_table = QTableWidget()
-        self.process_table.setColumnCount(6)
-        self.process_table.setHorizontalHeaderLabels([
-            "PID", "Process Name", "User", "Memory (MB)", "State", "CPU %"
-        ])
+        self.process_model = ProcessTableModel(self)
+        self.process_proxy = ProcessFilterProxyModel(self)
+        self.process_proxy.setSourceModel(self.process_model)
+        
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_proxy)
         
         # Configure table
+        # Fixed starting widths: ResizeToContents would measure every row
         header = self.process_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
+        for column, width in self.COLUMN_WIDTHS.items():
+            header.resizeSection(column, width)
         
-        self.process_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.process_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.process_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.process_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.process_table.setAlternatingRowColors(True)
         self.process_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.process_table.customContextMenuRequested.connect(self.show_context_menu)
@@ -88,7 +301,7 @@ class ProcessMonitorWidget(QWidget):
         # Search
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search processes...")
-        self.search_input.textChanged.connect(self.filter_processes)
+        self.search_input.textChanged.connect(lambda _: self._filter_timer.start())
         self.search_input.setMaximumWidth(250)
         
         # Auto-refresh checkbox
@@ -111,7 +324,7 @@ class ProcessMonitorWidget(QWidget):
         toolbar.addWidget(self.kill_btn)
         
         # Enable kill button when row selected
-        self.process_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.process_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         
         return toolbar
     
@@ -132,14 +345,33 @@ class ProcessMonitorWidget(QWidget):
         """Handle refresh button click"""
         self.refresh_requested.emit()
     
+    def hideEvent(self, event):
+        """Pause auto-refresh while the table can't be seen"""
+        super().hideEvent(event)
+        self._was_auto = self.auto_refresh_timer.isActive()
+        self.auto_refresh_timer.stop()
+    
+    def showEvent(self, event):
+        """Resume a paused auto-refresh and catch up immediately"""
+        super().showEvent(event)
+        if self._was_auto and self.auto_refresh_check.isChecked():
+            self._was_auto = False
+            self.auto_refresh_timer.start(5000)
+            self.refresh_requested.emit()
+    
+    def _process_at(self, index):
+        """Get the ProcessInfo behind a (proxy) table index"""
+        source = self.process_proxy.mapToSource(index)
+        if not source.isValid():
+            return None
+        return self.process_model.processes[source.row()]
+    
     def on_kill_clicked(self):
         """Handle kill button click"""
-        selected = self.process_table.selectedItems()
+        selected = self.process_table.selectionModel().selectedRows()
         if selected:
-            row = selected[0].row()
-            if row < len(self.filtered_processes):
-                process = self.filtered_processes[row]
-                
+            process = self._process_at(selected[0])
+            if process:
                 reply = QMessageBox.question(
                     self,
                     "Confirm Kill",
@@ -152,21 +384,19 @@ class ProcessMonitorWidget(QWidget):
     
     def on_selection_changed(self):
         """Handle table selection change"""
-        has_selection = len(self.process_table.selectedItems()) > 0
+        has_selection = self.process_table.selectionModel().hasSelection()
         self.kill_btn.setEnabled(has_selection)
     
     def show_context_menu(self, position):
         """Show context menu for process actions"""
-        item = self.process_table.itemAt(position)
-        if not item:
+        index = self.process_table.indexAt(position)
+        if not index.isValid():
             return
         
-        row = item.row()
-        if row < 0 or row >= len(self.filtered_processes):
+        process = self._process_at(index)
+        if not process:
             return
         
-        process = self.filtered_processes[row]
-        
         menu = QMenu()
         menu.setStyleSheet("""
             QMenu {
@@ -191,77 +421,25 @@ class ProcessMonitorWidget(QWidget):
     def update_processes(self, processes):
         """Update process list display"""
         self.processes = processes
-        self.filtered_processes = processes.copy()
-        self.filter_processes(self.search_input.text())
-        self.populate_table()
         
-        self.status_label.setText(f"Showing {len(self.filtered_processes)} of {len(processes)} processes")
+        # The diff update can emit many row signals; repaint once at the end
+        self.process_table.setUpdatesEnabled(False)
+        try:
+            self.process_model.update_processes(processes)
+        finally:
+            self.process_table.setUpdatesEnabled(True)
+        self.update_status()
     
     def filter_processes(self, search_text):
-        """Filter processes based on search text"""
-        if not search_text:
-            self.filtered_processes = self.processes.copy()
-        else:
-            search_lower = search_text.lower()
-            self.filtered_processes = [
-                p for p in self.processes
-                if search_lower in p.name.lower() or
-                   search_lower in str(p.pid) or
-                   search_lower in p.user.lower()
-            ]
-        
-        self.populate_table()
-        self.status_label.setText(f"Showing {len(self.filtered_processes)} of {len(self.processes)} processes")
+        """Filter processes based on search text (no-op if unchanged)"""
+        if self.process_proxy.set_search_text(search_text):
+            self.update_status()
     
-    def populate_table(self):
-        """Populate table with filtered processes"""
-        self.process_table.setSortingEnabled(False)
-        self.process_table.setRowCount(0)
-        
-        for process in self.filtered_processes:
-            row = self.process_table.rowCount()
-            self.process_table.insertRow(row)
-            
-            # PID
-            pid_item = QTableWidgetItem(str(process.pid))
-            pid_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            pid_item.setForeground(QColor("#9cdcfe"))
-            self.process_table.setItem(row, 0, pid_item)
-            
-            # Process Name
-            name_item = QTableWidgetItem(process.name)
-            name_item.setForeground(QColor("#ffffff"))
-            self.process_table.setItem(row, 1, name_item)
-            
-            # User
-            user_item = QTableWidgetItem(process.user)
-            user_item.setForeground(QColor("#dcdcaa"))
-            self.process_table.setItem(row, 2, user_item)
-            
-            # Memory
-            mem_item = QTableWidgetItem(str(process.mem_mb))
-            mem_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            mem_item.setForeground(QColor("#b5cea8"))
-            self.process_table.setItem(row, 3, mem_item)
-            
-            # State
-            state_item = QTableWidgetItem(process.state_text)
-            state_item.setTextAlignment(Qt.AlignCenter)
-            if process.state == 'R':
-                state_item.setForeground(QColor("#4ec9b0"))  # Green for running
-            elif process.state == 'Z':
-                state_item.setForeground(QColor("#f48771"))  # Red for zombie
-            else:
-                state_item.setForeground(QColor("#cccccc"))
-            self.process_table.setItem(row, 4, state_item)
-            
-            # CPU % (placeholder)
-            cpu_item = QTableWidgetItem("N/A")
-            cpu_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            cpu_item.setForeground(QColor("#888888"))
-            self.process_table.setItem(row, 5, cpu_item)
-        
-        self.process_table.setSortingEnabled(True)
+    def update_status(self):
+        """Show visible vs total process counts"""
+        self.status_label.setText(
+            f"Showing {self.process_proxy.rowCount()} of {self.process_model.rowCount()} processes"
+        )
     
     def set_device_connected(self, connected):
         """Update UI based on device connection status"""
@@ -271,6 +449,6 @@ class ProcessMonitorWidget(QWidget):
         self.auto_refresh_check.setEnabled(connected)
         
         if not connected:
-            self.process_table.setRowCount(0)
+            self.process_model.set_processes([])
             self.status_label.setText("No device selected")
             self.auto_refresh_timer.stop()
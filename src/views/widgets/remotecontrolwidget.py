@@ -4,13 +4,34 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton,
     QLabel, QLineEdit, QGroupBox, QMessageBox, QFileDialog, QCheckBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QPainter, QColor, QFont, QPixmap
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import QPainter, QColor, QFont, QPixmap, QImage
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
 
+class _ImageLoadSignals(QObject):
+    """Signals for _ImageLoadTask (QRunnable is not a QObject)"""
+    
+    finished = pyqtSignal(int, object, QImage)  # generation, file key, image
+
+
+class _ImageLoadTask(QRunnable):
+    """Background screenshot decode"""
+    
+    def __init__(self, generation, key, signals):
+        super().__init__()
+        self.generation = generation
+        self.key = key
+        self.signals = signals
+    
+    def run(self):
+        # QImage (unlike QPixmap) may be created off the GUI thread
+        self.signals.finished.emit(self.generation, self.key, QImage(self.key[0]))
+
+
 class TouchPadWidget(QWidget):
     """Touch pad with live screen preview"""
     
@@ -24,7 +45,29 @@ class TouchPadWidget(QWidget):
         self.device_height = 1920
         self.swipe_start = None
         self.swipe_end = None
-        self.screen_pixmap = None
+        self.screen_pixmap = None  # Scaled for display
+        self._raw_pixmap = None  # As loaded, kept for rescaling on resize
+        self._image_key = None  # (path, mtime_ns, size) of the loaded file
+        self._interacting = False  # Between a press and the settle delay
+        self._smooth = False  # Whether screen_pixmap was smooth-scaled
+        
+        # Screenshots decode on the thread pool; stale results are dropped
+        self._load_gen = 0
+        self._pending_key = None  # File key of the load in flight
+        self._load_signals = _ImageLoadSignals(self)
+        self._load_signals.finished.connect(self._on_image_loaded)
+        
+        # One pending refresh at a time; each tap/swipe restarts it
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(500)
+        self._refresh_timer.timeout.connect(self.refresh_screen_requested.emit)
+        
+        # Marks the end of an interaction, when a smooth rescale is worth it
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(300)
+        self._settle_timer.timeout.connect(self._on_interaction_settled)
         
         # Calculate display size
         self.max_display_height = 350
@@ -66,30 +109,111 @@ class TouchPadWidget(QWidget):
         """
         Set screenshot to display
         
+        The image is decoded in the background and shown once loaded.
+        A newer request supersedes one still in flight.
+        
         Args:
             image_path: Path to screenshot image
         """
         try:
-            self.screen_pixmap = QPixmap(image_path)
-            
-            # Scale to fit widget while maintaining aspect ratio
-            self.screen_pixmap = self.screen_pixmap.scaled(
-                self.width(),
-                self.height(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            self.update()
-            logger.info(f"Screen image loaded: {image_path}")
-        except Exception as e:
+            stat = os.stat(image_path)
+        except OSError as e:
             logger.error(f"Failed to load screen image: {e}")
+            self._clear_image()
+            return
+        
+        # Skip reload and rescale if the file hasn't changed
+        key = (image_path, stat.st_mtime_ns, stat.st_size)
+        if key == self._image_key or key == self._pending_key:
+            return
+        
+        self._load_gen += 1
+        self._pending_key = key
+        QThreadPool.globalInstance().start(
+            _ImageLoadTask(self._load_gen, key, self._load_signals)
+        )
+    
+    def _on_image_loaded(self, generation, key, image):
+        """Show a decoded screenshot unless a newer load superseded it"""
+        if generation != self._load_gen:
+            return
+        self._pending_key = None
+        
+        if image.isNull():
+            logger.error(f"Failed to load screen image: {key[0]}")
+            self._clear_image()
+            return
+        
+        self._raw_pixmap = QPixmap.fromImage(image)
+        self._image_key = key
+        self._rescale_pixmap()
+        
+        self.update()
+        logger.info(f"Screen image loaded: {key[0]}")
+    
+    def _clear_image(self):
+        """Forget the current screenshot"""
+        self.screen_pixmap = None
+        self._raw_pixmap = None
+        self._image_key = None
+        self.update()
+    
+    def _rescale_pixmap(self):
+        """
+        Scale the loaded screenshot to fit the widget
+        
+        Uses a nearest-neighbor scale while the user is interacting;
+        the smooth pass runs once the interaction settles.
+        """
+        if self._raw_pixmap is None or self._raw_pixmap.isNull():
             self.screen_pixmap = None
+            return
+        
+        self._smooth = not self._interacting
+        
+        # Skip the transform when it wouldn't visibly change the size
+        raw_size = self._raw_pixmap.size()
+        target = raw_size.scaled(self.size(), Qt.KeepAspectRatio)
+        if (abs(target.width() - raw_size.width()) <= 2
+                and abs(target.height() - raw_size.height()) <= 2):
+            self.screen_pixmap = self._raw_pixmap
+            self._smooth = True
+            return
+        
+        # Scale to fit widget while maintaining aspect ratio
+        self.screen_pixmap = self._raw_pixmap.scaled(
+            self.width(),
+            self.height(),
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation if self._smooth else Qt.FastTransformation
+        )
+    
+    def _on_interaction_settled(self):
+        """Upgrade a fast-scaled screenshot once interaction stops"""
+        self._interacting = False
+        if self.screen_pixmap is not None and not self._smooth:
+            self._rescale_pixmap()
+            self.update()
+    
+    def resizeEvent(self, event):
+        """Rescale the current screenshot from memory"""
+        super().resizeEvent(event)
+        if self._raw_pixmap is not None:
+            self._rescale_pixmap()
+    
+    def hideEvent(self, event):
+        """Drop a pending screen refresh and any load nobody will see"""
+        super().hideEvent(event)
+        self._refresh_timer.stop()
+        self._load_gen += 1
+        self._pending_key = None
     
     def mousePressEvent(self, event):
         """Handle mouse press"""
         self.swipe_start = event.pos()
         self.swipe_end = None
+        self._interacting = True
+        self._settle_timer.stop()
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release"""
@@ -104,8 +228,7 @@ class TouchPadWidget(QWidget):
                 self.tap_event.emit(event.pos().x(), event.pos().y())
                 
                 # Request screen refresh after tap
-                from PyQt5.QtCore import QTimer
-                QTimer.singleShot(500, self.refresh_screen_requested.emit)
+                self._refresh_timer.start()
             else:
                 # Swipe
                 self.swipe_event.emit(
@@ -114,11 +237,12 @@ class TouchPadWidget(QWidget):
                 )
                 
                 # Request screen refresh after swipe
-                from PyQt5.QtCore import QTimer
-                QTimer.singleShot(500, self.refresh_screen_requested.emit)
+                self._refresh_timer.start()
             
             self.swipe_start = None
             self.swipe_end = None
+        
+        self._settle_timer.start()
     
     def paintEvent(self, event):
         """Draw touchpad with screen preview"""
@@ -293,9 +417,7 @@ class RemoteControlWidget(QWidget):
         ]
         
         for label, key, row, col in buttons:
-            btn = QPushButton(label)
-            btn.clicked.connect(lambda checked, k=key: self.key_requested.emit(k))
-            layout.addWidget(btn, row, col)
+            layout.addWidget(self._key_button(label, key), row, col)
         
         group.setLayout(layout)
         return group
@@ -305,18 +427,9 @@ class RemoteControlWidget(QWidget):
         group = QGroupBox("Volume")
         layout = QHBoxLayout()
         
-        vol_up = QPushButton("🔊 Up")
-        vol_up.clicked.connect(lambda: self.key_requested.emit("VOLUME_UP"))
-        
-        vol_down = QPushButton("🔉 Down")
-        vol_down.clicked.connect(lambda: self.key_requested.emit("VOLUME_DOWN"))
-        
-        mute = QPushButton("🔇 Mute")
-        mute.clicked.connect(lambda: self.key_requested.emit("VOLUME_MUTE"))
-        
-        layout.addWidget(vol_up)
-        layout.addWidget(vol_down)
-        layout.addWidget(mute)
+        layout.addWidget(self._key_button("🔊 Up", "VOLUME_UP"))
+        layout.addWidget(self._key_button("🔉 Down", "VOLUME_DOWN"))
+        layout.addWidget(self._key_button("🔇 Mute", "VOLUME_MUTE"))
         
         group.setLayout(layout)
         return group
@@ -327,29 +440,35 @@ class RemoteControlWidget(QWidget):
         layout = QGridLayout()
         
         # D-Pad buttons
-        up = QPushButton("▲")
-        up.clicked.connect(lambda: self.key_requested.emit("DPAD_UP"))
-        layout.addWidget(up, 0, 1)
-        
-        left = QPushButton("◀")
-        left.clicked.connect(lambda: self.key_requested.emit("DPAD_LEFT"))
-        layout.addWidget(left, 1, 0)
-        
-        center = QPushButton("●")
-        center.clicked.connect(lambda: self.key_requested.emit("DPAD_CENTER"))
-        layout.addWidget(center, 1, 1)
-        
-        right = QPushButton("▶")
-        right.clicked.connect(lambda: self.key_requested.emit("DPAD_RIGHT"))
-        layout.addWidget(right, 1, 2)
-        
-        down = QPushButton("▼")
-        down.clicked.connect(lambda: self.key_requested.emit("DPAD_DOWN"))
-        layout.addWidget(down, 2, 1)
+        layout.addWidget(self._key_button("▲", "DPAD_UP"), 0, 1)
+        layout.addWidget(self._key_button("◀", "DPAD_LEFT"), 1, 0)
+        layout.addWidget(self._key_button("●", "DPAD_CENTER"), 1, 1)
+        layout.addWidget(self._key_button("▶", "DPAD_RIGHT"), 1, 2)
+        layout.addWidget(self._key_button("▼", "DPAD_DOWN"), 2, 1)
         
         group.setLayout(layout)
         return group
     
+    def _key_button(self, label, key):
+        """
+        Create a button that sends a key event
+        
+        Args:
+            label: Button text
+            key: Key name, stored as the button's "keycode" property
+            
+        Returns:
+            QPushButton connected to _on_key_button_clicked
+        """
+        btn = QPushButton(label)
+        btn.setProperty("keycode", key)
+        btn.clicked.connect(self._on_key_button_clicked)
+        return btn
+    
+    def _on_key_button_clicked(self):
+        """Emit the key of whichever key button was clicked"""
+        self.key_requested.emit(self.sender().property("keycode"))
+    
     def on_tap(self, x, y):
         """Handle tap event"""
         # Scale coordinates to device screen
@@ -1,26 +1,103 @@
 """Interactive ADB terminal widget"""
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
-    QLineEdit, QPushButton, QLabel, QListWidget,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, 
+    QLineEdit, QPushButton, QLabel, QListWidget, QListView,
     QSplitter, QMenu, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QTextCursor, QKeyEvent
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QTimer, QAbstractListModel, QModelIndex, QSignalBlocker
+)
+from PyQt5.QtGui import QFont, QTextCursor, QKeyEvent, QTextCharFormat, QColor
+from collections import OrderedDict, deque
+from functools import wraps
+from itertools import groupby, islice
+from operator import itemgetter
+from time import perf_counter_ns
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Quick commands for the sidebar: (command, description)
+_COMMON_COMMANDS = (
+    ("ls", "List directory contents"),
+    ("ls -la", "List all files with details"),
+    ("pwd", "Print working directory"),
+    ("cd /sdcard", "Change to SD card directory"),
+    ("cat /proc/cpuinfo", "Show CPU information"),
+    ("cat /proc/meminfo", "Show memory information"),
+    ("df -h", "Show disk usage"),
+    ("ps", "List running processes"),
+    ("top -n 1", "Show top processes"),
+    ("getprop", "List all system properties"),
+    ("pm list packages", "List all packages"),
+    ("pm list packages -3", "List 3rd party packages"),
+    ("dumpsys battery", "Show battery info"),
+    ("dumpsys window", "Show window info"),
+    ("screencap /sdcard/screenshot.png", "Take screenshot"),
+    ("input text 'Hello'", "Send text input"),
+    ("input keyevent 3", "Send HOME key"),
+    ("reboot", "Reboot device"),
+    ("exit", "Exit shell"),
+)
+_COMMON_COMMAND_DISPLAY = tuple(f"{cmd}   # {description}" for cmd, description in _COMMON_COMMANDS)
+
+_WELCOME_MESSAGE = """
+╔══════════════════════════════════════════════════════════╗
+║          ADB Shell Terminal - Ready                      ║
+╚══════════════════════════════════════════════════════════╝
+
+Connected to device. Enter ADB shell commands below.
+Type 'help' for available commands, or 'clear' to clear screen.
+
+"""
+
+_HELP_TEXT = """
+Available Commands:
+  - Any ADB shell command (ls, cd, ps, etc.)
+  - 'clear' - Clear terminal screen
+  - 'help' - Show this help message
+  - Use ↑↓ to navigate command history
+  - Double-click common commands on the right to use them
+
+Common ADB Commands:
+  ls              - List files
+  cd <path>       - Change directory
+  cat <file>      - Display file contents
+  ps              - List processes
+  pm list packages - List installed packages
+  getprop         - Show system properties
+  dumpsys <service> - Dump system service info
+
+"""
+
+
+def _profiled(method):
+    """Log a TerminalWidget method's duration when _profile_mode is on"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self._profile_mode:
+            return method(self, *args, **kwargs)
+        start = perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            logger.debug(f"{method.__name__}: {(perf_counter_ns() - start) / 1e6:.3f} ms")
+    return wrapper
+
 
 class CommandInput(QLineEdit):
     """Custom line edit with command history navigation"""
     
     command_submitted = pyqtSignal(str)
     
+    MAX_HISTORY = 500  # Oldest commands are forgotten beyond this
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.command_history = []
+        self.command_history = OrderedDict()  # Ordered set, most recent last
         self.history_index = -1
+        self._history_snapshot = None  # Tuple of command_history for navigation
         self.setPlaceholderText("Enter ADB shell command...")
         
         # Connect return key to submit command
@@ -30,9 +107,12 @@ class CommandInput(QLineEdit):
         """Submit the current command"""
         command = self.text().strip()
         if command:
-            # Add to history
-            if not self.command_history or self.command_history[-1] != command:
-                self.command_history.append(command)
+            # Add to history, moving a repeated command to the most recent slot
+            self.command_history.pop(command, None)
+            self.command_history[command] = None
+            if len(self.command_history) > self.MAX_HISTORY:
+                self.command_history.popitem(last=False)
+            self._history_snapshot = None
             
             # Emit signal
             self.command_submitted.emit(command)
@@ -50,38 +130,137 @@ class CommandInput(QLineEdit):
         else:
             super().keyPressEvent(event)
     
+    def _history(self):
+        """Command history as a tuple, rebuilt only after it changes"""
+        if self._history_snapshot is None:
+            self._history_snapshot = tuple(self.command_history)
+        return self._history_snapshot
+    
     def navigate_history_up(self):
         """Navigate to previous command in history"""
         if self.command_history and self.history_index > 0:
             self.history_index -= 1
-            self.setText(self.command_history[self.history_index])
+            self.setText(self._history()[self.history_index])
     
     def navigate_history_down(self):
         """Navigate to next command in history"""
         if self.command_history and self.history_index < len(self.command_history) - 1:
             self.history_index += 1
-            self.setText(self.command_history[self.history_index])
+            self.setText(self._history()[self.history_index])
         elif self.history_index == len(self.command_history) - 1:
             self.history_index = len(self.command_history)
             self.clear()
     
     def get_history(self):
         """Get command history"""
-        return self.command_history.copy()
+        return list(self._history())
+    
+    def clear_history(self):
+        """Forget all commands"""
+        self.command_history.clear()
+        self.history_index = -1
+        self._history_snapshot = None
+
+
+class CommandHistoryModel(QAbstractListModel):
+    """Submitted commands, most recent first, without duplicates"""
+    
+    def __init__(self, max_commands, parent=None):
+        super().__init__(parent)
+        self.max_commands = max_commands
+        self.commands = deque()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.commands)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self.commands[index.row()]
+        return None
+    
+    def add_command(self, command):
+        """
+        Put a command at the top, removing an older copy
+        
+        Args:
+            command: Command text
+        """
+        if command in self.commands:
+            row = self.commands.index(command)
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.commands[row]
+            self.endRemoveRows()
+        elif len(self.commands) >= self.max_commands:
+            last = len(self.commands) - 1
+            self.beginRemoveRows(QModelIndex(), last, last)
+            self.commands.pop()
+            self.endRemoveRows()
+        
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self.commands.appendleft(command)
+        self.endInsertRows()
+    
+    def set_commands(self, commands):
+        """
+        Replace all commands in one reset
+        
+        Args:
+            commands: Commands, most recent first
+        """
+        self.beginResetModel()
+        self.commands = deque(islice(commands, self.max_commands))
+        self.endResetModel()
+    
+    def clear(self):
+        """Remove all commands"""
+        self.set_commands([])
 
 
 class TerminalWidget(QWidget):
-    """Interactive terminal for ADB shell commands"""
+    """
+    Interactive terminal for ADB shell commands
+    
+    The output path is bound by Qt's document layout and painting, not by
+    Python work, so it is tuned through widget choice, batching, bounded
+    scroll-back and cached formats. Set _profile_mode to log timings that
+    check this.
+    """
     
     # Signals
     command_entered = pyqtSignal(str)
     clear_requested = pyqtSignal()
     
+    MAX_SCROLLBACK_BLOCKS = 5000  # Oldest output lines are dropped beyond this
+    FLUSH_INTERVAL_MS = 16  # Appended output is written at most this often
+    
+    _profile_mode = False  # Debug: log output-path timings
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.common_commands = self.get_common_commands()
+        self.common_commands = _COMMON_COMMANDS
+        
+        # Appended output is buffered and written in batches
+        self._pending = []  # (text, color) pairs
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_output)
+        
+        # One shared text format per output color
+        self._fmt_cache = {
+            color: self._make_format(color)
+            for color in ("#00ff00", "#00ffff", "#ff0000", "#ffff00", "#ffffff")
+        }
+        
         self.setup_ui()
     
+    @staticmethod
+    def _make_format(color):
+        """Create a text format with the given foreground color (hex)"""
+        format = QTextCharFormat()
+        format.setForeground(QColor(color))
+        return format
+    
     def setup_ui(self):
         """Setup terminal UI"""
         layout = QVBoxLayout()
@@ -101,10 +280,14 @@ class TerminalWidget(QWidget):
         terminal_layout.addWidget(header)
         
         # Output display
-        self.output_display = QTextEdit()
+        self.output_display = QPlainTextEdit()
         self.output_display.setReadOnly(True)
+        self.output_display.setMaximumBlockCount(self.MAX_SCROLLBACK_BLOCKS)
+        
+        # Insertion cursor kept at the end of the document between flushes
+        self._end_cursor = QTextCursor(self.output_display.document())
         self.output_display.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #00ff00;
                 font-family: 'Consolas', 'Courier New', monospace;
@@ -166,8 +349,12 @@ class TerminalWidget(QWidget):
         history_header_layout.addWidget(self.clear_history_btn)
         sidebar_layout.addLayout(history_header_layout)
         
-        self.history_list = QListWidget()
-        self.history_list.itemDoubleClicked.connect(self.on_history_item_clicked)
+        self.history_model = CommandHistoryModel(CommandInput.MAX_HISTORY, self)
+        self.history_list = QListView()
+        self.history_list.setModel(self.history_model)
+        self.history_list.setUniformItemSizes(True)
+        self.history_list.setEditTriggers(QListView.NoEditTriggers)
+        self.history_list.doubleClicked.connect(self.on_history_item_clicked)
         sidebar_layout.addWidget(self.history_list)
         
         # Common commands
@@ -181,9 +368,6 @@ class TerminalWidget(QWidget):
         self.common_list.customContextMenuRequested.connect(self.show_common_command_menu)
         sidebar_layout.addWidget(self.common_list)
         
-        # NOW populate common commands AFTER creating the widget
-        self.populate_common_commands()
-        
         sidebar_widget.setLayout(sidebar_layout)
         splitter.addWidget(sidebar_widget)
         
@@ -196,53 +380,34 @@ class TerminalWidget(QWidget):
         
         # Show welcome message
         self.show_welcome_message()
-
+        
+        # Fill the sidebar once the event loop is running
+        QTimer.singleShot(0, self._post_show_init)
+    
+    def _post_show_init(self):
+        """Initialization that can wait until after the first paint"""
+        self.populate_common_commands()
+    
     def show_welcome_message(self):
         """Display welcome message"""
-        welcome = """
-╔══════════════════════════════════════════════════════════╗
-║          ADB Shell Terminal - Ready                      ║
-╚══════════════════════════════════════════════════════════╝
-
-Connected to device. Enter ADB shell commands below.
-Type 'help' for available commands, or 'clear' to clear screen.
-
-"""
-        self.output_display.setPlainText(welcome)
-    
-    def get_common_commands(self):
-        """Get list of common ADB commands"""
-        return [
-            ("ls", "List directory contents"),
-            ("ls -la", "List all files with details"),
-            ("pwd", "Print working directory"),
-            ("cd /sdcard", "Change to SD card directory"),
-            ("cat /proc/cpuinfo", "Show CPU information"),
-            ("cat /proc/meminfo", "Show memory information"),
-            ("df -h", "Show disk usage"),
-            ("ps", "List running processes"),
-            ("top -n 1", "Show top processes"),
-            ("getprop", "List all system properties"),
-            ("pm list packages", "List all packages"),
-            ("pm list packages -3", "List 3rd party packages"),
-            ("dumpsys battery", "Show battery info"),
-            ("dumpsys window", "Show window info"),
-            ("screencap /sdcard/screenshot.png", "Take screenshot"),
-            ("input text 'Hello'", "Send text input"),
-            ("input keyevent 3", "Send HOME key"),
-            ("reboot", "Reboot device"),
-            ("exit", "Exit shell"),
-        ]
+        self.output_display.setPlainText(_WELCOME_MESSAGE)
     
     def populate_common_commands(self):
         """Populate common commands list"""
-        for cmd, description in self.common_commands:
-            self.common_list.addItem(f"{cmd}   # {description}")
+        # No per-item itemChanged/currentRowChanged while filling the list
+        blocker = QSignalBlocker(self.common_list)
+        self.common_list.addItems(_COMMON_COMMAND_DISPLAY)
+        
+        # Keep the raw command on each item for the click/copy handlers
+        for row, (cmd, _) in enumerate(_COMMON_COMMANDS):
+            self.common_list.item(row).setData(Qt.UserRole, cmd)
+        blocker.unblock()
     
+    @_profiled
     def on_command_submitted(self, command):
         """Handle command submission"""
-        # Add to history list
-        self.history_list.insertItem(0, command)
+        # Add to the top of the history list, dropping an older copy
+        self.history_model.add_command(command)
         
         # Show command in output
         self.append_output(f"\n$ {command}\n", "#00ffff")
@@ -260,50 +425,82 @@ Type 'help' for available commands, or 'clear' to clear screen.
         
         logger.info(f"Command entered: {command}")
     
-    def on_history_item_clicked(self, item):
+    def on_history_item_clicked(self, index):
         """Handle history item double-click"""
-        command = item.text()
+        command = index.data()
         self.command_input.setText(command)
         self.command_input.setFocus()
     
     def on_common_command_clicked(self, item):
         """Handle common command double-click"""
-        # Extract command (before the #)
-        full_text = item.text()
-        command = full_text.split("#")[0].strip()
+        command = self._common_command(item)
         self.command_input.setText(command)
         self.command_input.setFocus()
     
+    def _common_command(self, item):
+        """Get the command behind a common commands list item"""
+        return item.data(Qt.UserRole)
+    
+    @_profiled
     def append_output(self, text, color="#00ff00"):
         """
         Append text to output display
         
+        The text is buffered and written on the next flush.
+        
         Args:
             text: Text to append
             color: Text color (hex)
         """
-        cursor = self.output_display.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        
-        # Set color
-        format = cursor.charFormat()
-        format.setForeground(Qt.GlobalColor(self._hex_to_qt_color(color)))
-        cursor.setCharFormat(format)
-        
-        cursor.insertText(text)
-        self.output_display.setTextCursor(cursor)
-        self.output_display.ensureCursorVisible()
-    
-    def _hex_to_qt_color(self, hex_color):
-        """Convert hex color to Qt color constant (simplified)"""
-        color_map = {
-            "#00ff00": Qt.green,
-            "#00ffff": Qt.cyan,
-            "#ff0000": Qt.red,
-            "#ffff00": Qt.yellow,
-            "#ffffff": Qt.white,
-        }
-        return color_map.get(hex_color, Qt.green)
+        # Start a flush when the buffer goes from empty to non-empty
+        if not self._pending:
+            self._flush_timer.start()
+        self._pending.append((text, color))
+    
+    def _flush_output(self):
+        """Write buffered output, one insert per run of same-colored text"""
+        if not self._pending:
+            return
+        
+        chunks, self._pending = self._pending, []
+        
+        if self._profile_mode:
+            start = perf_counter_ns()
+        
+        cursor = self._end_cursor
+        if not cursor.atEnd():
+            cursor.movePosition(QTextCursor.End)
+        
+        self.output_display.setUpdatesEnabled(False)
+        try:
+            cursor.beginEditBlock()
+            for color, group in groupby(chunks, key=itemgetter(1)):
+                format = self._fmt_cache.get(color)
+                if format is None:
+                    format = self._fmt_cache[color] = self._make_format(color)
+                cursor.insertText(''.join(text for text, _ in group), format)
+            cursor.endEditBlock()
+            
+            if self._profile_mode:
+                inserted = perf_counter_ns()
+            
+            scrollbar = self.output_display.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+        finally:
+            self.output_display.setUpdatesEnabled(True)
+        
+        if self._profile_mode:
+            total = perf_counter_ns() - start
+            insert = inserted - start
+            logger.debug(
+                f"_flush_output: {len(chunks)} chunks in {total / 1e6:.3f} ms, "
+                f"document insert {insert / max(total, 1):.0%}"
+            )
+    
+    def _discard_pending_output(self):
+        """Drop buffered output that hasn't been written yet"""
+        self._pending.clear()
+        self._flush_timer.stop()
     
     def display_output(self, output, is_error=False):
         """
@@ -322,31 +519,14 @@ Type 'help' for available commands, or 'clear' to clear screen.
     
     def clear_output(self):
         """Clear terminal output"""
+        self._discard_pending_output()
         self.output_display.clear()
         self.show_welcome_message()
         self.clear_requested.emit()
     
     def show_help(self):
         """Show help text"""
-        help_text = """
-Available Commands:
-  - Any ADB shell command (ls, cd, ps, etc.)
-  - 'clear' - Clear terminal screen
-  - 'help' - Show this help message
-  - Use ↑↓ to navigate command history
-  - Double-click common commands on the right to use them
-
-Common ADB Commands:
-  ls              - List files
-  cd <path>       - Change directory
-  cat <file>      - Display file contents
-  ps              - List processes
-  pm list packages - List installed packages
-  getprop         - Show system properties
-  dumpsys <service> - Dump system service info
-
-"""
-        self.append_output(help_text, "#ffff00")
+        self.append_output(_HELP_TEXT, "#ffff00")
     
     def set_device_connected(self, connected):
         """
@@ -359,15 +539,15 @@ Common ADB Commands:
         self.send_btn.setEnabled(connected)
         
         if not connected:
+            self._discard_pending_output()
             self.output_display.clear()
             self.append_output("\n⚠ No device connected\n", "#ff0000")
             self.append_output("Please select a device to use the terminal.\n", "#ffff00")
 
     def clear_history(self):
         """Clear command history"""
-        self.history_list.clear()
-        self.command_input.command_history.clear()
-        self.command_input.history_index = -1
+        self.history_model.clear()
+        self.command_input.clear_history()
         self.append_output("\n🗑️ Command history cleared\n", "#ffff00")
         logger.info("Command history cleared")
     
@@ -384,9 +564,7 @@ Common ADB Commands:
         action = menu.exec_(self.common_list.mapToGlobal(position))
         
         if action == copy_action:
-            # Extract command
-            full_text = item.text()
-            command = full_text.split("#")[0].strip()
+            command = self._common_command(item)
             # Copy to clipboard
             clipboard = QApplication.clipboard()
             clipboard.setText(command)
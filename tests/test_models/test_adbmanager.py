@@ -9,33 +9,44 @@ from models.devicemodel import DeviceInfo
 class TestADBManager(unittest.TestCase):
     """Test ADB Manager functionality"""
     
-    @patch('models.adbmanager.AdbClient')
-    def test_initialization(self, mock_client):
+    @classmethod
+    def setUpClass(cls):
+        """Patch AdbClient once for the whole class"""
+        cls._patcher = patch('models.adbmanager.AdbClient')
+        cls.mock_client = cls._patcher.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls._patcher.stop()
+    
+    def setUp(self):
+        """Give each test a clean mock (calls, return values, side effects)"""
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
+    
+    def test_initialization(self):
         """Test ADB Manager initialization"""
         adb_manager = ADBManager()
         
         self.assertIsNotNone(adb_manager)
         self.assertEqual(adb_manager.host, "127.0.0.1")
         self.assertEqual(adb_manager.port, 5037)
-        mock_client.assert_called_once()
+        self.mock_client.assert_called_once()
     
-    @patch('models.adbmanager.AdbClient')
-    def test_connect_device_success(self, mock_client):
+    def test_connect_device_success(self):
         """Test successful device connection"""
-        mock_client.return_value.remote_connect.return_value = True
-        mock_client.return_value.version.return_value = "1.0.0"
+        self.mock_client.return_value.remote_connect.return_value = True
+        self.mock_client.return_value.version.return_value = "1.0.0"
         
         adb_manager = ADBManager()
         result = adb_manager.connect_device("192.168.1.100", 5555)
         
         self.assertTrue(result)
-        mock_client.return_value.remote_connect.assert_called_with("192.168.1.100", 5555)
+        self.mock_client.return_value.remote_connect.assert_called_with("192.168.1.100", 5555)
     
-    @patch('models.adbmanager.AdbClient')
-    def test_connect_device_failure(self, mock_client):
+    def test_connect_device_failure(self):
         """Test failed device connection"""
-        mock_client.return_value.remote_connect.side_effect = Exception("Connection failed")
-        mock_client.return_value.version.return_value = "1.0.0"
+        self.mock_client.return_value.remote_connect.side_effect = Exception("Connection failed")
+        self.mock_client.return_value.version.return_value = "1.0.0"
         
         adb_manager = ADBManager()
         result = adb_manager.connect_device("invalid_ip", 5555)
@@ -0,0 +1,103 @@
+"""Unit tests for the app table model's in-place row removal"""
+
+import unittest
+
+from PyQt5.QtCore import QCoreApplication
+
+from models.appmodel import AppInfo
+from views.widgets.appmanagerwidget import AppTableModel
+
+
+def make_apps(count):
+    """Build AppInfo objects with distinct package names"""
+    return [AppInfo(package_name=f"com.example.app{i}") for i in range(count)]
+
+
+class TestAppTableModel(unittest.TestCase):
+    """Test AppTableModel.update_apps"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+    
+    def setUp(self):
+        self.model = AppTableModel()
+        self.events = []
+        self.model.modelReset.connect(lambda: self.events.append(("reset",)))
+        self.model.rowsRemoved.connect(
+            lambda parent, first, last: self.events.append(("removed", first, last))
+        )
+        self.model.rowsInserted.connect(
+            lambda parent, first, last: self.events.append(("inserted", first, last))
+        )
+    
+    def test_empty_model_resets(self):
+        """Test updating an empty model is a single reset"""
+        apps = make_apps(5)
+        self.model.update_apps(apps)
+        
+        self.assertEqual(self.events, [("reset",)])
+        self.assertEqual(self.model.rowCount(), 5)
+    
+    def test_scattered_removals(self):
+        """Test vanished apps are removed in runs, bottom-up"""
+        apps = make_apps(10)
+        self.model.set_apps(apps)
+        self.events.clear()
+        
+        kept = [app for i, app in enumerate(apps) if i not in (2, 6, 7)]
+        self.model.update_apps(kept)
+        
+        self.assertEqual(self.events, [("removed", 6, 7), ("removed", 2, 2)])
+        self.assertEqual(self.model.rowCount(), 7)
+        self.assertIs(self.model.apps, kept)
+    
+    def test_removals_above_run_threshold_reset(self):
+        """Test too many scattered removals fall back to a reset"""
+        apps = make_apps((AppTableModel.MAX_REMOVE_RUNS + 1) * 2)
+        self.model.set_apps(apps)
+        self.events.clear()
+        
+        self.model.update_apps(apps[::2])
+        
+        self.assertEqual(self.events, [("reset",)])
+        self.assertEqual(self.model.rowCount(), len(apps[::2]))
+    
+    def test_unchanged_list_resets_without_removals(self):
+        """Test the same rows again never emit removals"""
+        apps = make_apps(5)
+        self.model.set_apps(apps)
+        self.events.clear()
+        
+        self.model.update_apps(list(apps))
+        
+        self.assertNotIn("removed", [event[0] for event in self.events])
+        self.assertEqual(self.model.rowCount(), 5)
+    
+    def test_new_rows_reset(self):
+        """Test a growing list (new rows appended) falls back to a reset"""
+        apps = make_apps(5)
+        self.model.set_apps(apps[:3])
+        self.events.clear()
+        
+        self.model.update_apps(apps)
+        
+        self.assertEqual(self.events, [("reset",)])
+        self.assertEqual(self.model.rowCount(), 5)
+    
+    def test_removals_beyond_loaded_rows(self):
+        """Test only loaded rows emit removals; unloaded rows stay lazy"""
+        batch = AppTableModel.FETCH_BATCH_SIZE
+        apps = make_apps(batch + 50)
+        self.model.set_apps(apps)
+        self.events.clear()
+        
+        kept = apps[:batch] + apps[batch + 10:]
+        self.model.update_apps(kept)
+        
+        self.assertEqual(self.events, [])
+        self.assertEqual(self.model.rowCount(), batch)
+        self.assertTrue(self.model.canFetchMore())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Unit tests for the process table model's diff update"""
+
+import unittest
+
+from PyQt5.QtCore import QCoreApplication
+
+from models.processmodel import ProcessInfo
+from views.widgets.processmonitorwidget import ProcessTableModel
+
+
+def make_processes(pids, mem_size=1024):
+    """Build ProcessInfo objects for the given PIDs"""
+    return [ProcessInfo(pid=pid, name=f"proc{pid}", user="root", mem_size=mem_size) for pid in pids]
+
+
+class TestProcessTableModel(unittest.TestCase):
+    """Test ProcessTableModel.update_processes"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+    
+    def setUp(self):
+        self.model = ProcessTableModel()
+        self.events = []
+        self.model.modelReset.connect(lambda: self.events.append(("reset",)))
+        self.model.rowsRemoved.connect(
+            lambda parent, first, last: self.events.append(("removed", first, last))
+        )
+        self.model.rowsInserted.connect(
+            lambda parent, first, last: self.events.append(("inserted", first, last))
+        )
+        self.model.dataChanged.connect(
+            lambda top_left, bottom_right, roles=None: self.events.append(
+                ("changed", top_left.row(), bottom_right.row())
+            )
+        )
+    
+    def pids(self):
+        return [p.pid for p in self.model.processes]
+    
+    def test_empty_model_resets(self):
+        """Test the first update on an empty model is a single reset"""
+        self.model.update_processes(make_processes(range(1, 6)))
+        
+        self.assertEqual(self.events, [("reset",)])
+        self.assertEqual(self.model.rowCount(), 5)
+    
+    def test_scattered_removals(self):
+        """Test exited processes are removed in runs, bottom-up"""
+        self.model.set_processes(make_processes(range(1, 11)))
+        self.events.clear()
+        
+        self.model.update_processes(make_processes([1, 2, 4, 5, 6, 9, 10]))
+        
+        self.assertEqual(self.events, [("removed", 6, 7), ("removed", 2, 2)])
+        self.assertEqual(self.pids(), [1, 2, 4, 5, 6, 9, 10])
+        self.assertEqual(len(self.model.haystacks), 7)
+    
+    def test_removals_above_run_threshold_reset(self):
+        """Test too many scattered removals fall back to a reset"""
+        count = (ProcessTableModel.MAX_REMOVE_RUNS + 1) * 2
+        self.model.set_processes(make_processes(range(count)))
+        self.events.clear()
+        
+        self.model.update_processes(make_processes(range(0, count, 2)))
+        
+        self.assertEqual(self.events, [("reset",)])
+        self.assertEqual(self.pids(), list(range(0, count, 2)))
+    
+    def test_unchanged_rows_emit_no_data_changed(self):
+        """Test refreshed but identical processes emit nothing"""
+        self.model.set_processes(make_processes(range(1, 6)))
+        self.events.clear()
+        
+        self.model.update_processes(make_processes(range(1, 6)))
+        
+        self.assertEqual(self.events, [])
+    
+    def test_changed_row_emits_data_changed(self):
+        """Test only the row whose values changed emits dataChanged"""
+        self.model.set_processes(make_processes(range(1, 6)))
+        self.events.clear()
+        
+        processes = make_processes(range(1, 6))
+        processes[2].mem_size = 4096
+        self.model.update_processes(processes)
+        
+        self.assertEqual(self.events, [("changed", 2, 2)])
+        self.assertIs(self.model.processes[2], processes[2])
+    
+    def test_new_rows_appended(self):
+        """Test new PIDs are appended in one insert"""
+        self.model.set_processes(make_processes(range(1, 4)))
+        self.events.clear()
+        
+        self.model.update_processes(make_processes([1, 2, 3, 7, 8]))
+        
+        self.assertEqual(self.events, [("inserted", 3, 4)])
+        self.assertEqual(self.pids(), [1, 2, 3, 7, 8])
+        self.assertEqual(len(self.model.haystacks), 5)
+    
+    def test_duplicate_pids_do_not_break_updates(self):
+        """Test a duplicated PID is collapsed to one row"""
+        self.model.set_processes(make_processes([1, 2, 2, 3]))
+        
+        self.assertEqual(self.pids(), [1, 2, 3])
+        self.model.update_processes(make_processes([1, 2, 3]))
+        self.assertEqual(self.pids(), [1, 2, 3])
+
+if __name__ == '__main__':
+    unittest.main()